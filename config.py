@@ -3,85 +3,140 @@ Configuration settings for the report generator
 Centralized place for all configuration options
 """
 
+from collections import ChainMap
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Dict
 
+# Sentinel distinguishing "key not set" from a stored None
+_MISSING = object()
+
 
 class ReportConfig:
     """Configuration class for report generation"""
 
-    # Default settings
-    DEFAULT_SETTINGS = {
-        # Report template type
-        "template": "standard",  # Options: "standard", "business", "academic", "technical"
-        # Claude model settings
-        "model": "claude-3-5-sonnet-20241022",
-        "max_tokens": 2000,
-        "temperature": 0,
-        # Search settings
-        "search_depth": "advanced",  # Options: "basic", "advanced"
-        "max_search_results": 4,
-        "max_sources_per_section": 8,
-        "total_source_limit": 12,
-        # Content settings
-        "section_word_count": "300-500",
-        "intro_word_count": "150-250",
-        "conclusion_word_count": "150-250",
-        "executive_summary_word_count": "200-300",
-        # File settings
-        "output_directory": "generated_reports",
-        "timestamp_format": "%Y%m%d_%H%M%S",
-        # Prompt settings
-        "prompt_version": "default",
-        "language": "english",
-        # Rate limiting settings
-        "enable_rate_limiting": True,
-        "anthropic_rate_limit_delay": 1.0,  # Seconds between Anthropic API calls
-        "tavily_rate_limit_delay": 0.5,  # Seconds between Tavily API calls
-        # Retry settings
-        "enable_retries": True,
-        "max_retries": 3,
-        "retry_base_delay": 1.0,
-        "retry_max_delay": 60.0,
-        # Token management settings
-        "enable_token_management": True,
-        "token_model_name": "claude-3-5-sonnet-20241022",
-        "token_response_buffer": 2000,  # tokens reserved for response
-        "token_sources_percentage": 0.6,  # 60% of available tokens for sources
-        "token_min_source_content": 200,  # minimum chars per source
-        "token_max_source_content": 1000,  # maximum chars per source
-        "token_min_sources": 3,  # minimum number of sources to include
-        "token_enable_usage_reporting": True,  # show token usage reports
-        # Search result caching settings
-        "enable_search_caching": True,
-        "cache_dir": "cache",  # directory for cache files
-        "cache_ttl_hours": 24.0,  # cache time-to-live in hours
-        "max_cache_size": 1000,  # maximum number of entries in memory
-        "similarity_threshold": 0.75,  # minimum similarity for cache hits
-        "enable_file_cache": True,  # persist cache to disk
-        "cache_reporting": True,  # show cache performance reports
-        # Prompt versioning and analytics settings
-        "enable_prompt_versioning": True,
-        "prompt_versions_dir": "prompt_versions",  # directory for versioned prompts
-        "prompt_usage_log": "prompt_usage.json",  # usage analytics log file
-        "enable_prompt_analytics": True,  # track prompt performance
-        "prompt_quality_tracking": True,  # enable quality score tracking
-        "auto_suggest_best_prompts": False,  # automatically suggest best performing versions
-    }
+    # Settings live in the ChainMap; no per-instance __dict__ is needed
+    __slots__ = ("settings", "_cache")
+
+    # Default settings (read-only, shared by every instance)
+    DEFAULT_SETTINGS = MappingProxyType(
+        {
+            # Report template type
+            "template": "standard",  # Options: "standard", "business", "academic", "technical"
+            # Claude model settings
+            "model": "claude-3-5-sonnet-20241022",
+            "max_tokens": 2000,
+            "temperature": 0,
+            "enable_prompt_caching": False,  # Mark long prompts for Claude's cache
+            # Message Batches: half price, but replies can take minutes or hours
+            "batch_mode": False,
+            "batch_window_seconds": 30.0,  # Collect requests this long per batch
+            "batch_poll_interval": 20.0,  # First wait between status checks
+            "batch_max_poll_interval": 300.0,
+            # Search settings
+            "search_depth": "advanced",  # Options: "basic", "advanced"
+            "max_search_results": 4,
+            "search_include_raw_content": False,  # Full page text; only a fallback
+            "max_sources_per_section": 8,
+            "total_source_limit": 12,
+            # Content settings
+            "section_word_count": "300-500",
+            "intro_word_count": "150-250",
+            "conclusion_word_count": "150-250",
+            "executive_summary_word_count": "200-300",
+            # File settings
+            "output_directory": "generated_reports",
+            "timestamp_format": "%Y%m%d_%H%M%S",
+            # Prompt settings
+            "prompt_version": "default",
+            "language": "english",
+            # Concurrency settings
+            "max_concurrent_sections": 4,  # Sections researched and written at once
+            # Rate limiting settings
+            "enable_rate_limiting": True,
+            "anthropic_rate_limit_delay": 1.0,  # Seconds between Anthropic API calls
+            "tavily_rate_limit_delay": 0.5,  # Seconds between Tavily API calls
+            "anthropic_rate_limit_burst": 1,  # Anthropic calls allowed back to back
+            "tavily_rate_limit_burst": 1,  # Tavily calls allowed back to back
+            "anthropic_max_concurrency": 8,  # Halved on 429s, regrown gradually
+            "anthropic_target_latency": None,  # Seconds; None ignores latency
+            "rate_limit_headroom": 0.1,  # Pause when under 10% of a limit remains
+            # Retry settings
+            "enable_retries": True,
+            "max_retries": 3,
+            "retry_base_delay": 1.0,
+            "retry_max_delay": 60.0,
+            # Token management settings
+            "enable_token_management": True,
+            "token_model_name": "claude-3-5-sonnet-20241022",
+            "token_response_buffer": 2000,  # tokens reserved for response
+            "token_sources_percentage": 0.6,  # 60% of available tokens for sources
+            "token_min_source_content": 200,  # minimum chars per source
+            "token_max_source_content": 1000,  # maximum chars per source
+            "token_min_sources": 3,  # minimum number of sources to include
+            "token_enable_usage_reporting": True,  # show token usage reports
+            # Search result caching settings
+            "enable_search_caching": True,
+            "cache_dir": "cache",  # directory for cache files
+            "cache_ttl_hours": 24.0,  # cache time-to-live in hours
+            "max_cache_size": 1000,  # maximum number of entries in memory
+            "similarity_threshold": 0.75,  # minimum similarity for cache hits
+            "enable_file_cache": True,  # persist cache to disk
+            "cache_reporting": True,  # show cache performance reports
+            # Response caching settings
+            "enable_response_cache": True,  # reuse identical planning/query replies
+            # Reuse sections written for similar requests
+            "enable_semantic_cache": False,
+            "semantic_cache_threshold": 0.92,  # minimum cosine similarity for hits
+            "semantic_cache_ttl_hours": 24.0,
+            # Prompt versioning and analytics settings
+            "enable_prompt_versioning": True,
+            "prompt_versions_dir": "prompt_versions",  # directory for versioned prompts
+            "prompt_usage_log": "prompt_usage.json",  # usage analytics log file
+            "enable_prompt_analytics": True,  # track prompt performance
+            "prompt_quality_tracking": True,  # enable quality score tracking
+            "auto_suggest_best_prompts": False,  # automatically suggest best performing versions
+        }
+    )
+
+    # Section type -> word count setting; anything else uses section_word_count
+    _SECTION_KEY = MappingProxyType(
+        {
+            "introduction": "intro_word_count",
+            "conclusion": "conclusion_word_count",
+            "executive_summary": "executive_summary_word_count",
+        }
+    )
 
     def __init__(self, custom_settings: Dict[str, Any] = None):
         """Initialize configuration with optional custom settings"""
-        self.settings = self.DEFAULT_SETTINGS.copy()
-
+        # Overrides live in the first map; defaults are shared, not copied.
+        # Without overrides no mutable map is allocated until the first set().
         if custom_settings:
-            self.settings.update(custom_settings)
+            self.settings = ChainMap(dict(custom_settings), self.DEFAULT_SETTINGS)
+        else:
+            self.settings = ChainMap(self.DEFAULT_SETTINGS)
+
+        # Memoized lookups, invalidated by set()
+        self._cache: Dict[str, Any] = {}
 
     def get(self, key: str, default=None):
         """Get a configuration value"""
-        return self.settings.get(key, default)
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.settings.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self._cache[key] = value
+        return value
 
     def set(self, key: str, value: Any):
         """Set a configuration value"""
+        if self.settings.maps[0] is self.DEFAULT_SETTINGS:
+            # Materialize the override map in place; callers may hold .settings
+            self.settings.maps.insert(0, {})
         self.settings[key] = value
+        self._cache.pop(key, None)
 
     def get_prompt_template(self) -> str:
         """Get the prompt template type"""
@@ -89,29 +144,20 @@ class ReportConfig:
 
     def get_word_count_for_section_type(self, section_type: str) -> str:
         """Get word count based on section type"""
-        word_count_map = {
-            "introduction": self.get("intro_word_count"),
-            "conclusion": self.get("conclusion_word_count"),
-            "executive_summary": self.get("executive_summary_word_count"),
-            "default": self.get("section_word_count"),
-        }
-        return word_count_map.get(section_type, word_count_map["default"])
+        return self.get(self._SECTION_KEY.get(section_type, "section_word_count"))
 
 
-# Pre-defined configurations for different use cases
-BUSINESS_CONFIG = ReportConfig(
-    {
+# Overrides for the pre-defined configurations, instantiated on first use
+_PRESET_OVERRIDES: Dict[str, Dict[str, Any]] = {
+    "business": {
         "template": "business",
         "section_word_count": "400-600",
         "executive_summary_word_count": "250-350",
         "max_search_results": 5,
         "token_max_source_content": 800,  # Longer content for business analysis
         "token_sources_percentage": 0.65,  # More sources for comprehensive analysis
-    }
-)
-
-ACADEMIC_CONFIG = ReportConfig(
-    {
+    },
+    "academic": {
         "template": "academic",
         "section_word_count": "500-700",
         "intro_word_count": "200-300",
@@ -120,22 +166,16 @@ ACADEMIC_CONFIG = ReportConfig(
         "search_depth": "advanced",
         "token_max_source_content": 1200,  # Longer content for detailed research
         "token_sources_percentage": 0.7,  # More sources for academic rigor
-    }
-)
-
-TECHNICAL_CONFIG = ReportConfig(
-    {
+    },
+    "technical": {
         "template": "technical",
         "section_word_count": "400-600",
         "max_search_results": 5,
         "max_sources_per_section": 10,
         "token_max_source_content": 1000,  # Detailed technical content
         "token_sources_percentage": 0.65,  # Balance between sources and prompt
-    }
-)
-
-QUICK_CONFIG = ReportConfig(
-    {
+    },
+    "quick": {
         "template": "standard",
         "section_word_count": "200-300",
         "intro_word_count": "100-150",
@@ -143,22 +183,50 @@ QUICK_CONFIG = ReportConfig(
         "max_search_results": 3,
         "token_max_source_content": 400,  # Shorter content for quick generation
         "token_sources_percentage": 0.5,  # Less sources for speed
-    }
-)
-
-# Configuration presets
-CONFIG_PRESETS = {
-    "business": BUSINESS_CONFIG,
-    "academic": ACADEMIC_CONFIG,
-    "technical": TECHNICAL_CONFIG,
-    "quick": QUICK_CONFIG,
-    "standard": ReportConfig(),  # Default
+    },
+    "standard": {},  # Default
 }
 
+# Legacy module-level preset names, resolved lazily via __getattr__
+_PRESET_ALIASES = {
+    "BUSINESS_CONFIG": "business",
+    "ACADEMIC_CONFIG": "academic",
+    "TECHNICAL_CONFIG": "technical",
+    "QUICK_CONFIG": "quick",
+}
+
+
+@lru_cache(maxsize=None)
+def _load_preset(preset_name: str) -> ReportConfig:
+    """Build a preset configuration once and reuse it afterwards"""
+    return ReportConfig(_PRESET_OVERRIDES[preset_name])
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily resolve BUSINESS_CONFIG, CONFIG_PRESETS and friends"""
+    if name in _PRESET_ALIASES:
+        return _load_preset(_PRESET_ALIASES[name])
+    if name == "CONFIG_PRESETS":
+        return {preset: _load_preset(preset) for preset in _PRESET_OVERRIDES}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_config(preset_name: str = "standard") -> ReportConfig:
-    """Get a configuration preset"""
-    return CONFIG_PRESETS.get(preset_name, ReportConfig())
+    """
+    Get a configuration preset
+
+    Presets are cached, so every caller receives the same instance and
+    ReportConfig.set() on it is visible process-wide. Use
+    create_custom_config() for a private copy.
+    """
+    if preset_name in _PRESET_OVERRIDES:
+        return _load_preset(preset_name)
+    return ReportConfig()
+
+
+def clear_config_cache() -> None:
+    """Drop cached presets so the next get_config() rebuilds them"""
+    _load_preset.cache_clear()
 
 
 def create_custom_config(**kwargs) -> ReportConfig:
@@ -4,15 +4,30 @@ Prompt Versioning Initialization Script
 Migrates existing static prompts to the versioning system and sets up initial versions
 """
 
+import sys
+from typing import List
+
 from config import get_config
 from utils.prompt_loader import PromptLoader
 from utils.prompt_versioning import get_prompt_version_manager
 
+# Output is collected here and written in a few large chunks, not line by line
+_output: List[str] = []
+emit = _output.append
+
+
+def flush_output() -> None:
+    """Write buffered output to stdout in a single call"""
+    if _output:
+        sys.stdout.write("".join(_output))
+        sys.stdout.flush()
+        _output.clear()
+
 
 def initialize_prompt_versioning():
     """Initialize the prompt versioning system with existing prompts"""
-    print("🚀 Initializing Prompt Versioning System")
-    print("=" * 60)
+    emit("🚀 Initializing Prompt Versioning System\n")
+    emit("=" * 60 + "\n")
 
     # Get configuration with versioning enabled
     config = get_config("standard")
@@ -20,60 +35,62 @@ def initialize_prompt_versioning():
     config.set("prompt_version", "v1.0_static")
 
     # Create prompt loader
-    loader = PromptLoader(config)
+    loader = PromptLoader.for_config(config)
 
     if not loader.enable_versioning:
-        print("❌ Prompt versioning is not enabled or failed to initialize")
+        emit("❌ Prompt versioning is not enabled or failed to initialize\n")
+        flush_output()
         return
 
-    print("✅ Prompt versioning system initialized")
+    emit("✅ Prompt versioning system initialized\n")
 
     # Migrate existing prompts
-    print("\n📦 Migrating existing static prompts...")
+    emit("\n📦 Migrating existing static prompts...\n")
     migration_results = loader.migrate_static_prompts_to_versioned()
 
     if migration_results:
-        print(f"✅ Successfully migrated {len(migration_results)} prompt types:")
+        emit(f"✅ Successfully migrated {len(migration_results)} prompt types:\n")
         for prompt_name, count in migration_results.items():
-            print(f"   • {prompt_name}: {count} version(s)")
+            emit(f"   • {prompt_name}: {count} version(s)\n")
     else:
-        print("⚠️ No prompts were migrated (they may already exist)")
+        emit("⚠️ No prompts were migrated (they may already exist)\n")
 
     # Set active versions
-    print("\n🎯 Setting active versions...")
+    emit("\n🎯 Setting active versions...\n")
     version_manager = get_prompt_version_manager(config.settings)
 
     for prompt_name in migration_results:
         success = version_manager.set_active_version(prompt_name, "v1.0_static")
         if success:
-            print(f"   ✅ Set {prompt_name} active version to v1.0_static")
+            emit(f"   ✅ Set {prompt_name} active version to v1.0_static\n")
 
-    print("\n📊 Current system status:")
-    print(f"   • Total prompt types: {len(version_manager.prompts)}")
-    print(f"   • Versioning enabled: {loader.enable_versioning}")
-    print(f"   • Analytics enabled: {version_manager.enable_analytics}")
+    emit("\n📊 Current system status:\n")
+    emit(f"   • Total prompt types: {len(version_manager.prompts)}\n")
+    emit(f"   • Versioning enabled: {loader.enable_versioning}\n")
+    emit(f"   • Analytics enabled: {version_manager.enable_analytics}\n")
+    flush_output()
 
     return loader, version_manager
 
 
 def demo_prompt_versioning(loader: PromptLoader, version_manager):
     """Demonstrate prompt versioning functionality"""
-    print("\n🧪 Demonstrating Prompt Versioning Features")
-    print("=" * 60)
+    emit("\n🧪 Demonstrating Prompt Versioning Features\n")
+    emit("=" * 60 + "\n")
 
     # Test prompt retrieval
-    print("\n1. Testing prompt retrieval...")
+    emit("\n1. Testing prompt retrieval...\n")
     structure_prompt = loader.get_structure_prompt("AI in healthcare")
     if structure_prompt:
-        print(
-            f"   ✅ Successfully retrieved structure prompt ({len(structure_prompt)} chars)"
+        emit(
+            f"   ✅ Successfully retrieved structure prompt ({len(structure_prompt)} chars)\n"
         )
-        print(f"   📝 Preview: {structure_prompt[:100]}...")
+        emit(f"   📝 Preview: {structure_prompt[:100]}...\n")
     else:
-        print("   ❌ Failed to retrieve structure prompt")
+        emit("   ❌ Failed to retrieve structure prompt\n")
 
     # Add an improved version
-    print("\n2. Adding an improved prompt version...")
+    emit("\n2. Adding an improved prompt version...\n")
     improved_prompt = """You are an expert report structure planner. Create a detailed structure for a research report about: {topic}
 
 Your task is to design a comprehensive report structure that provides excellent coverage of the topic while maintaining professional standards.
@@ -110,62 +127,67 @@ Make the structure engaging, thorough, and well-organized for the topic: {topic}
     )
 
     if success:
-        print("   ✅ Added improved version v1.2_enhanced")
+        emit("   ✅ Added improved version v1.2_enhanced\n")
 
         # Set as active
         version_manager.set_active_version("REPORT_STRUCTURE_PROMPT", "v1.2_enhanced")
-        print("   ✅ Set v1.2_enhanced as active version")
+        emit("   ✅ Set v1.2_enhanced as active version\n")
     else:
-        print("   ⚠️ Improved version may already exist")
+        emit("   ⚠️ Improved version may already exist\n")
 
     # Test with the new version
-    print("\n3. Testing with improved version...")
+    emit("\n3. Testing with improved version...\n")
     config = get_config("standard")
     config.set("prompt_version", "v1.2_enhanced")
-    new_loader = PromptLoader(config)
+    new_loader = PromptLoader.for_config(config)
 
     new_prompt = new_loader.get_structure_prompt("AI in healthcare")
     if new_prompt and new_prompt != structure_prompt:
-        print("   ✅ Successfully using improved version")
-        print(
-            f"   📊 Length difference: {len(new_prompt) - len(structure_prompt)} chars"
+        emit("   ✅ Successfully using improved version\n")
+        emit(
+            f"   📊 Length difference: {len(new_prompt) - len(structure_prompt)} chars\n"
         )
     else:
-        print("   ⚠️ Still using original version or no difference detected")
+        emit("   ⚠️ Still using original version or no difference detected\n")
 
     # Simulate some usage for analytics
-    print("\n4. Simulating usage for analytics...")
-    for i in range(5):
-        loader.log_prompt_usage(
-            prompt_name="REPORT_STRUCTURE_PROMPT",
-            success=True,
-            quality_score=0.85 + (i * 0.02),  # Slightly improving scores
-            execution_time=1.2 + (i * 0.1),
-            section_type="structure",
-        )
+    emit("\n4. Simulating usage for analytics...\n")
+    loader.log_prompt_usage_batch(
+        [
+            {
+                "prompt_name": "REPORT_STRUCTURE_PROMPT",
+                "success": True,
+                "quality_score": 0.85 + (i * 0.02),  # Slightly improving scores
+                "execution_time": 1.2 + (i * 0.1),
+                "section_type": "structure",
+            }
+            for i in range(5)
+        ]
+    )
 
-    print("   ✅ Logged 5 usage events")
+    emit("   ✅ Logged 5 usage events\n")
 
     # Show performance metrics
-    print("\n5. Performance metrics:")
+    emit("\n5. Performance metrics:\n")
     metrics = version_manager.get_performance_metrics("REPORT_STRUCTURE_PROMPT")
 
     for version, metric in metrics.items():
-        print(f"   Version {version}:")
-        print(f"     • Usage: {metric.total_usage}")
-        print(f"     • Success rate: {metric.success_rate:.1%}")
-        print(f"     • Quality score: {metric.avg_quality_score:.2f}")
+        emit(f"   Version {version}:\n")
+        emit(f"     • Usage: {metric.total_usage}\n")
+        emit(f"     • Success rate: {metric.success_rate:.1%}\n")
+        emit(f"     • Quality score: {metric.avg_quality_score:.2f}\n")
 
     # Generate performance report
-    print("\n6. Generated performance report:")
+    emit("\n6. Generated performance report:\n")
     report = version_manager.create_performance_report("REPORT_STRUCTURE_PROMPT")
-    print(report)
+    emit(f"{report}\n")
+    flush_output()
 
 
 def show_usage_instructions():
     """Show instructions for using the prompt versioning system"""
-    print("\n📚 How to Use Prompt Versioning")
-    print("=" * 60)
+    emit("\n📚 How to Use Prompt Versioning\n")
+    emit("=" * 60 + "\n")
 
     instructions = """
 1. **Set Prompt Version in Config:**
@@ -205,12 +227,13 @@ def show_usage_instructions():
    - `auto_suggest_best_prompts`: Auto-switch to best performers
     """
 
-    print(instructions)
+    emit(f"{instructions}\n")
+    flush_output()
 
 
 if __name__ == "__main__":
-    print("🎯 Prompt Versioning System Setup & Demo")
-    print("This script initializes prompt versioning and demonstrates its features\n")
+    emit("🎯 Prompt Versioning System Setup & Demo\n")
+    emit("This script initializes prompt versioning and demonstrates its features\n\n")
 
     # Initialize the system
     loader, version_manager = initialize_prompt_versioning()
@@ -222,10 +245,11 @@ if __name__ == "__main__":
         # Show usage instructions
         show_usage_instructions()
 
-        print("\n✅ Prompt versioning system is now ready!")
-        print(f"📁 Versions stored in: {version_manager.versions_dir}")
-        print(f"📊 Analytics logged to: {version_manager.usage_log_file}")
+        emit("\n✅ Prompt versioning system is now ready!\n")
+        emit(f"📁 Versions stored in: {version_manager.versions_dir}\n")
+        emit(f"📊 Analytics logged to: {version_manager.usage_log_file}\n")
     else:
-        print("❌ Failed to initialize prompt versioning system")
+        emit("❌ Failed to initialize prompt versioning system\n")
 
-    print("\n🎉 Setup complete! You can now use versioned prompts in your reports.")
+    emit("\n🎉 Setup complete! You can now use versioned prompts in your reports.\n")
+    flush_output()
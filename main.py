@@ -3,23 +3,21 @@
 Enhanced main entry point with template selection
 """
 
-import asyncio
+from contextlib import asynccontextmanager, nullcontext
+from functools import lru_cache
+import logging
 import sys
+from typing import TYPE_CHECKING, AsyncIterator, Tuple
+import zlib
 
-from rich.console import Console
-from rich.markdown import Markdown
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
+from rich.text import Text
 
 from config import get_config
-from report_generator import (
-    ImprovedReportGenerator,
-    generate_academic_report,
-    generate_business_report,
-    generate_quick_report,
-    generate_technical_report,
-)
+from utils.event_loop import run
 from utils.observability import (
     ComponentType,
     OperationType,
@@ -28,75 +26,167 @@ from utils.observability import (
     timed_operation,
 )
 
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+    from rich.markdown import Markdown
+    from tavily import AsyncTavilyClient
+
+    from report_generator import ImprovedReportGenerator
+
 console = Console()
 
 # Initialize structured logging
 logger = get_logger(ComponentType.REPORT_GENERATOR)
 obs = get_observability_manager()
 
+# Separator printed above and below a displayed report
+_RULE = "=" * 80
+
+# Health summary for a session in which no operation was recorded
+_NO_OPERATIONS_HEALTH = {
+    "status": "healthy",
+    "overall_error_rate": 0.0,
+    "total_operations": 0,
+}
+
+
+@asynccontextmanager
+async def _api_clients() -> AsyncIterator[Tuple["AsyncAnthropic", "AsyncTavilyClient"]]:
+    """Create the API clients shared by this run's generators and close them after"""
+    # Imported on first use so --help doesn't load the API clients
+    from report_generator import (
+        close_tavily_client,
+        create_anthropic_client,
+        create_tavily_client,
+    )
+
+    anthropic_client = create_anthropic_client(get_config("standard"))
+    tavily_client = create_tavily_client()
+    try:
+        yield anthropic_client, tavily_client
+    finally:
+        # Generators hold the clients; drop them before the pools close
+        _get_generator.cache_clear()
+        await anthropic_client.close()
+        await close_tavily_client(tavily_client)
+
+
+@lru_cache(maxsize=8)
+def _get_generator(
+    template: str, clients: Tuple["AsyncAnthropic", "AsyncTavilyClient"]
+) -> "ImprovedReportGenerator":
+    """Get the shared report generator for a template"""
+    from report_generator import ImprovedReportGenerator
+
+    anthropic_client, tavily_client = clients
+    return ImprovedReportGenerator(
+        get_config(template),
+        anthropic_client=anthropic_client,
+        tavily_client=tavily_client,
+    )
+
+
+@lru_cache(maxsize=4)
+def _render_markdown(report: str) -> "Markdown":
+    """Parse a report into a Markdown renderable, reusing recent parses"""
+    from rich.markdown import Markdown
+
+    return Markdown(report)
+
+
+def _print_report(report: str):
+    """Print a report between separator rules as a single console write"""
+    console.print(Group("\n" + _RULE, _render_markdown(report), _RULE))
+
+
+def _demo_user_id(prefix: str, topic: str) -> str:
+    """Derive a demo user ID that is stable across runs for the same topic"""
+    return "%s_%d" % (prefix, zlib.crc32(topic.encode("utf-8")) % 10000)
+
 
 def check_system_health():
     """Check system health before starting operations"""
     health = obs.get_health_status()
 
-    logger.info(
-        "System health check",
-        status=health["status"],
-        total_operations=health["total_operations"],
-        error_rate=health["overall_error_rate"],
-    )
+    if logger.is_enabled_for(logging.INFO):
+        logger.info(
+            "System health check",
+            status=health["status"],
+            total_operations=health["total_operations"],
+            error_rate=health["overall_error_rate"],
+        )
 
+    status = health["status"].upper()
     if health["status"] == "unhealthy":
-        console.print(
-            f"[bold red]⚠️ System health: {health['status'].upper()}[/bold red]"
+        message = Text.assemble(
+            (f"⚠️ System health: {status}", "bold red"),
+            "\n",
+            (f"Error rate: {health['overall_error_rate']:.1%}", "red"),
         )
-        console.print(f"[red]Error rate: {health['overall_error_rate']:.1%}[/red]")
-        return False
     elif health["status"] == "degraded":
-        console.print(f"[yellow]⚠️ System health: {health['status'].upper()}[/yellow]")
-        console.print(
-            f"[yellow]Error rate: {health['overall_error_rate']:.1%}[/yellow]"
+        message = Text.assemble(
+            (f"⚠️ System health: {status}", "yellow"),
+            "\n",
+            (f"Error rate: {health['overall_error_rate']:.1%}", "yellow"),
         )
     else:
-        console.print(f"[green]✅ System health: {health['status'].upper()}[/green]")
+        message = Text(f"✅ System health: {status}", style="green")
+    console.print(message)
+
+    return health["status"] != "unhealthy"
+
 
-    return True
+# Static template overview, built once and reprinted on every prompt cycle
+_TEMPLATE_TABLE = Table(title="📊 Available Report Templates")
+_TEMPLATE_TABLE.add_column("Template", style="cyan", no_wrap=True)
+_TEMPLATE_TABLE.add_column("Description", style="white")
+_TEMPLATE_TABLE.add_column("Best For", style="green")
+_TEMPLATE_TABLE.add_row(
+    "standard",
+    "Balanced research report with intro, main sections, conclusion",
+    "General research, overviews",
+)
+_TEMPLATE_TABLE.add_row(
+    "business",
+    "Executive summary, market analysis, strategic recommendations",
+    "Business analysis, market research",
+)
+_TEMPLATE_TABLE.add_row(
+    "academic",
+    "Abstract, literature review, analysis, conclusions",
+    "Academic research, scholarly analysis",
+)
+_TEMPLATE_TABLE.add_row(
+    "technical",
+    "Technical overview, specifications, implementation details",
+    "Technology analysis, system documentation",
+)
+_TEMPLATE_TABLE.add_row(
+    "quick",
+    "Shorter sections, faster generation, concise format",
+    "Quick insights, rapid analysis",
+)
 
 
 def show_template_options():
     """Display available report templates"""
-    table = Table(title="📊 Available Report Templates")
-    table.add_column("Template", style="cyan", no_wrap=True)
-    table.add_column("Description", style="white")
-    table.add_column("Best For", style="green")
-
-    table.add_row(
-        "standard",
-        "Balanced research report with intro, main sections, conclusion",
-        "General research, overviews",
-    )
-    table.add_row(
-        "business",
-        "Executive summary, market analysis, strategic recommendations",
-        "Business analysis, market research",
-    )
-    table.add_row(
-        "academic",
-        "Abstract, literature review, analysis, conclusions",
-        "Academic research, scholarly analysis",
-    )
-    table.add_row(
-        "technical",
-        "Technical overview, specifications, implementation details",
-        "Technology analysis, system documentation",
-    )
-    table.add_row(
-        "quick",
-        "Shorter sections, faster generation, concise format",
-        "Quick insights, rapid analysis",
-    )
+    console.print(_TEMPLATE_TABLE)
+
+
+def _status(message: str):
+    """Show a spinner while working, unless output is not a terminal"""
+    if console.is_terminal:
+        return console.status(message)
+    return nullcontext()
 
-    console.print(table)
+
+def _print_success(filename: str, template: str):
+    """Print the post-generation status block with a single console write"""
+    console.print(
+        "\n[bold green]✅ Report generated successfully![/bold green]\n"
+        f"[blue]📁 Saved to: {filename}[/blue]\n"
+        f"[yellow]📋 Template: {template.title()}[/yellow]"
+    )
 
 
 @timed_operation(
@@ -124,109 +214,92 @@ async def interactive_mode():
         )
     )
 
-    while True:
-        try:
-            # Show template options
-            show_template_options()
-
-            # Get template choice
-            template_choice = Prompt.ask(
-                "\n[cyan]Choose a template[/cyan]",
-                choices=["standard", "business", "academic", "technical", "quick"],
-                default="standard",
-            )
+    async with _api_clients() as clients:
+        while True:
+            try:
+                # Show template options
+                show_template_options()
+
+                # Get template choice
+                template_choice = Prompt.ask(
+                    "\n[cyan]Choose a template[/cyan]",
+                    choices=["standard", "business", "academic", "technical", "quick"],
+                    default="standard",
+                )
 
-            # Get topic from user
-            topic = console.input(
-                "\n[bold cyan]Enter your research topic: [/bold cyan]"
-            )
+                # Get topic from user
+                topic = console.input(
+                    "\n[bold cyan]Enter your research topic: [/bold cyan]"
+                )
 
-            if not topic.strip():
-                console.print("[red]Please enter a valid topic.[/red]")
-                continue
+                if not topic.strip():
+                    console.print("[red]Please enter a valid topic.[/red]")
+                    continue
 
-            # Generate report based on template choice
-            user_id = f"user_{hash(topic) % 10000}"  # Simple user ID for demo
+                # Generate report based on template choice
+                user_id = _demo_user_id("user", topic)  # Simple user ID for demo
 
-            logger.info(
-                "Starting report generation request",
-                topic=topic,
-                template=template_choice,
-                user_id=user_id,
-            )
+                if logger.is_enabled_for(logging.INFO):
+                    logger.info(
+                        "Starting report generation request",
+                        topic=topic,
+                        template=template_choice,
+                        user_id=user_id,
+                    )
 
-            console.print(
-                f"\n[green]Generating {template_choice} report on: {topic}[/green]"
-            )
+                console.print(
+                    f"\n[green]Generating {template_choice} report on: {topic}[/green]"
+                )
 
-            with console.status(f"[bold green]Generating {template_choice} report..."):
-                if template_choice == "business":
-                    report = await generate_business_report(topic)
-                elif template_choice == "academic":
-                    report = await generate_academic_report(topic)
-                elif template_choice == "technical":
-                    report = await generate_technical_report(topic)
-                elif template_choice == "quick":
-                    report = await generate_quick_report(topic)
-                else:
-                    config = get_config("standard")
-                    generator = ImprovedReportGenerator(config)
+                generator = _get_generator(template_choice, clients)
+                with _status(f"[bold green]Generating {template_choice} report..."):
                     report = await generator.generate_report(topic, user_id=user_id)
 
-            # Save report
-            config = get_config(template_choice)
-            generator = ImprovedReportGenerator(config)
-            filename = generator.save_report(report)
-
-            # Display success message
-            console.print(
-                "\n[bold green]✅ Report generated successfully![/bold green]"
-            )
-            console.print(f"[blue]📁 Saved to: {filename}[/blue]")
-            console.print(f"[yellow]📋 Template: {template_choice.title()}[/yellow]")
+                # Save report
+                filename = await generator.asave_report(report)
 
-            # Ask if user wants to see the report
-            show_report = Confirm.ask(
-                "\n[cyan]Display report now?[/cyan]", default=True
-            )
+                # Display success message
+                _print_success(filename, template_choice)
 
-            if show_report:
-                console.print("\n" + "=" * 80)
-                markdown_report = Markdown(report)
-                console.print(markdown_report)
-                console.print("=" * 80)
+                # Ask if user wants to see the report
+                show_report = Confirm.ask(
+                    "\n[cyan]Display report now?[/cyan]", default=True
+                )
 
-            # Ask if user wants to generate another report
-            continue_generating = Confirm.ask(
-                "\n[cyan]Generate another report?[/cyan]", default=True
-            )
+                if show_report:
+                    _print_report(report)
 
-            if not continue_generating:
-                console.print(
-                    "[yellow]Thanks for using the Report Generator! 👋[/yellow]"
+                # Ask if user wants to generate another report
+                continue_generating = Confirm.ask(
+                    "\n[cyan]Generate another report?[/cyan]", default=True
                 )
-                break
 
-        except KeyboardInterrupt:
-            logger.info("Interactive session cancelled by user")
-            console.print("\n\n[yellow]Operation cancelled.[/yellow]")
-            break
-        except Exception as e:
-            logger.error(
-                "Interactive session error",
-                error=e,
-                topic=topic if "topic" in locals() else "unknown",
-                template=template_choice
-                if "template_choice" in locals()
-                else "unknown",
-            )
-            console.print(f"\n[bold red]❌ Error: {e}[/bold red]")
+                if not continue_generating:
+                    console.print(
+                        "[yellow]Thanks for using the Report Generator! 👋[/yellow]"
+                    )
+                    break
 
-            # Ask if user wants to try again
-            retry = Confirm.ask("[cyan]Try again?[/cyan]", default=True)
-            if not retry:
-                logger.info("User chose not to retry after error")
+            except KeyboardInterrupt:
+                logger.info("Interactive session cancelled by user")
+                console.print("\n\n[yellow]Operation cancelled.[/yellow]")
                 break
+            except Exception as e:
+                logger.error(
+                    "Interactive session error",
+                    error=e,
+                    topic=topic if "topic" in locals() else "unknown",
+                    template=(
+                        template_choice if "template_choice" in locals() else "unknown"
+                    ),
+                )
+                console.print(f"\n[bold red]❌ Error: {e}[/bold red]")
+
+                # Ask if user wants to try again
+                retry = Confirm.ask("[cyan]Try again?[/cyan]", default=True)
+                if not retry:
+                    logger.info("User chose not to retry after error")
+                    break
 
     logger.info("Interactive mode session ended")
 
@@ -237,14 +310,15 @@ async def interactive_mode():
 async def single_report_mode(topic: str, template: str = "standard"):
     """Generate a single report for the given topic"""
 
-    user_id = f"cli_user_{hash(topic) % 10000}"
+    user_id = _demo_user_id("cli_user", topic)
 
-    logger.info(
-        "Starting single report generation",
-        topic=topic,
-        template=template,
-        user_id=user_id,
-    )
+    if logger.is_enabled_for(logging.INFO):
+        logger.info(
+            "Starting single report generation",
+            topic=topic,
+            template=template,
+            user_id=user_id,
+        )
 
     # Check system health
     if not check_system_health():
@@ -254,34 +328,18 @@ async def single_report_mode(topic: str, template: str = "standard"):
     console.print(f"[green]Generating {template} report on: {topic}[/green]")
 
     try:
-        with console.status(f"[bold green]Generating {template} report..."):
-            if template == "business":
-                report = await generate_business_report(topic)
-            elif template == "academic":
-                report = await generate_academic_report(topic)
-            elif template == "technical":
-                report = await generate_technical_report(topic)
-            elif template == "quick":
-                report = await generate_quick_report(topic)
-            else:
-                config = get_config(template)
-                generator = ImprovedReportGenerator(config)
+        async with _api_clients() as clients:
+            generator = _get_generator(template, clients)
+            with _status(f"[bold green]Generating {template} report..."):
                 report = await generator.generate_report(topic, user_id=user_id)
 
-        # Save report
-        config = get_config(template)
-        generator = ImprovedReportGenerator(config)
-        filename = generator.save_report(report)
+            # Save report
+            filename = await generator.asave_report(report)
 
-        console.print("\n[bold green]✅ Report generated successfully![/bold green]")
-        console.print(f"[blue]📁 Saved to: {filename}[/blue]")
-        console.print(f"[yellow]📋 Template: {template.title()}[/yellow]")
+        _print_success(filename, template)
 
         # Display the report
-        console.print("\n" + "=" * 80)
-        markdown_report = Markdown(report)
-        console.print(markdown_report)
-        console.print("=" * 80)
+        _print_report(report)
 
     except Exception as e:
         logger.error(
@@ -321,8 +379,6 @@ Built-in rate limiting prevents API limit issues automatically.""",
 def main():
     """Enhanced main function with argument parsing"""
 
-    logger.info("Application starting")
-
     # Simple argument parsing
     args = sys.argv[1:]
 
@@ -330,43 +386,56 @@ def main():
         print_usage()
         return
 
-    # Extract template if specified
+    logger.info("Application starting")
+
+    # Extract template if specified (--template NAME or --template=NAME)
     template = "standard"
-    if "--template" in args:
-        template_idx = args.index("--template")
-        if template_idx + 1 < len(args):
-            template = args[template_idx + 1]
-            args.pop(template_idx)  # Remove --template
-            args.pop(template_idx)  # Remove template value
+    topic_words = []
+    arg_iter = iter(args)
+    for arg in arg_iter:
+        if arg == "--template":
+            template = next(arg_iter, template)
+        elif arg.startswith("--template="):
+            template = arg[len("--template=") :]
+        else:
+            topic_words.append(arg)
+    args = topic_words
 
     try:
         # Generate report based on arguments
         if args:
             # Single report mode
             topic = " ".join(args)
-            asyncio.run(single_report_mode(topic, template))
+            run(single_report_mode(topic, template))
         else:
             # Interactive mode
-            asyncio.run(interactive_mode())
+            run(interactive_mode())
 
     finally:
-        # Show final system health summary
-        health = obs.get_health_status()
+        # Show final system health summary (skip summarizing if nothing ran)
+        if obs.enable_metrics and obs.metrics.metrics:
+            health = obs.get_health_status()
+        else:
+            health = _NO_OPERATIONS_HEALTH
 
         if health["total_operations"] > 0:
-            console.print("\n[dim]📊 Session Summary:[/dim]")
-            console.print(f"[dim]   Operations: {health['total_operations']}[/dim]")
             console.print(
-                f"[dim]   Success Rate: {(1 - health['overall_error_rate']):.1%}[/dim]"
+                Text(
+                    "\n📊 Session Summary:\n"
+                    f"   Operations: {health['total_operations']}\n"
+                    f"   Success Rate: {(1 - health['overall_error_rate']):.1%}\n"
+                    f"   System Health: {health['status'].upper()}",
+                    style="dim",
+                )
             )
-            console.print(f"[dim]   System Health: {health['status'].upper()}[/dim]")
 
-        logger.info(
-            "Application ending",
-            total_operations=health["total_operations"],
-            final_health_status=health["status"],
-            final_error_rate=health["overall_error_rate"],
-        )
+        if logger.is_enabled_for(logging.INFO):
+            logger.info(
+                "Application ending",
+                total_operations=health["total_operations"],
+                final_health_status=health["status"],
+                final_error_rate=health["overall_error_rate"],
+            )
 
 
 if __name__ == "__main__":
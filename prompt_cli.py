@@ -5,11 +5,23 @@ Command-line interface for managing prompt versions and analytics
 """
 
 import argparse
+from functools import lru_cache
 import sys
 from typing import Optional
 
-from config import get_config
-from utils.prompt_versioning import get_prompt_version_manager
+# Buffer size for prompt export/import files (fewer syscalls for large prompts)
+FILE_BUFFER_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=None)
+def _load():
+    """Load the configuration and its version manager once per process"""
+    # Imported only once a command is known, so --help stays fast
+    from config import get_config
+    from utils.prompt_versioning import get_prompt_version_manager
+
+    config = get_config()
+    return config, get_prompt_version_manager(config.settings)
 
 
 def list_prompts(version_manager):
@@ -18,30 +30,39 @@ def list_prompts(version_manager):
         print("No prompts found in the versioning system.")
         return
 
-    print("📋 Available Prompts and Versions")
-    print("=" * 60)
+    # Collected and written once, not printed line by line
+    lines = ["📋 Available Prompts and Versions", "=" * 60]
 
     for prompt_name, versions in version_manager.prompts.items():
-        print(f"\n🔹 {prompt_name}")
+        lines.append(f"\n🔹 {prompt_name}")
 
-        # Find active version
-        active_version = None
-        for version, prompt_version in versions.items():
-            if prompt_version.is_active:
-                active_version = version
-                break
+        active_version = version_manager.get_active_version(prompt_name)
 
         for version, prompt_version in versions.items():
             status = "✅ ACTIVE" if version == active_version else "   "
-            print(f"   {status} {version} - {prompt_version.description}")
-            print(f"        Created: {prompt_version.created_at}")
-            print(f"        Usage: {prompt_version.usage_count} times")
+            lines.append(f"   {status} {version} - {prompt_version.description}")
+            lines.append(f"        Created: {prompt_version.created_at}")
+            lines.append(f"        Usage: {prompt_version.usage_count} times")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def add_prompt_version(
-    version_manager, prompt_name: str, version: str, prompt_text: str, description: str
+    version_manager,
+    prompt_name: str,
+    version: str,
+    prompt_text: str,
+    description: str,
+    *,
+    activate: Optional[bool] = None,
 ):
-    """Add a new prompt version"""
+    """
+    Add a new prompt version
+
+    Args:
+        activate: Set the new version active (True), leave it inactive (False),
+            or ask only when stdin is a terminal (None)
+    """
     success = version_manager.add_prompt_version(
         prompt_name=prompt_name,
         version=version,
@@ -55,9 +76,11 @@ def add_prompt_version(
         print(f"❌ Failed to add version {version} (may already exist)")
         return False
 
-    # Ask if user wants to set as active
-    response = input(f"Set {version} as active version? (y/n): ").lower()
-    if response == "y":
+    # Ask if user wants to set as active, unless told or not interactive
+    if activate is None and sys.stdin.isatty():
+        response = input(f"Set {version} as active version? (y/n): ").lower()
+        activate = response == "y"
+    if activate:
         if version_manager.set_active_version(prompt_name, version):
             print(f"✅ Set {version} as active version")
         else:
@@ -83,24 +106,27 @@ def show_analytics(version_manager, prompt_name: Optional[str] = None):
             print(f"❌ No analytics found for {prompt_name}")
             return
 
-        print(f"📊 Analytics for {prompt_name}")
-        print("=" * 60)
+        lines = [f"📊 Analytics for {prompt_name}", "=" * 60]
 
         for version, metric in metrics.items():
-            print(f"\n🔹 Version {version}")
-            print(f"   Usage: {metric.total_usage} times")
-            print(f"   Success Rate: {metric.success_rate:.1%}")
-            print(f"   Quality Score: {metric.avg_quality_score:.2f}")
-            print(f"   Avg Execution Time: {metric.avg_execution_time:.2f}s")
+            lines.append(f"\n🔹 Version {version}")
+            lines.append(f"   Usage: {metric.total_usage} times")
+            lines.append(f"   Success Rate: {metric.success_rate:.1%}")
+            lines.append(f"   Quality Score: {metric.avg_quality_score:.2f}")
+            lines.append(f"   Avg Execution Time: {metric.avg_execution_time:.2f}s")
 
         # Show best performing version
         best = version_manager.get_best_performing_version(prompt_name)
         if best:
-            print(f"\n🏆 Best Performing Version: {best}")
+            lines.append(f"\n🏆 Best Performing Version: {best}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
     else:
-        # Show overall analytics
-        report = version_manager.create_performance_report()
-        print(report)
+        # Show overall analytics, streaming one prompt at a time
+        write = sys.stdout.write
+        for block in version_manager.iter_performance_report():
+            write(block)
+            write("\n")
 
 
 def export_prompt_version(
@@ -113,7 +139,7 @@ def export_prompt_version(
         return
 
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
+        with open(output_file, "w", encoding="utf-8", buffering=FILE_BUFFER_SIZE) as f:
             f.write(prompt_text)
         print(f"✅ Exported {prompt_name} v{version} to {output_file}")
     except Exception as e:
@@ -121,15 +147,26 @@ def export_prompt_version(
 
 
 def import_prompt_version(
-    version_manager, prompt_name: str, version: str, input_file: str, description: str
+    version_manager,
+    prompt_name: str,
+    version: str,
+    input_file: str,
+    description: str,
+    *,
+    activate: Optional[bool] = None,
 ):
     """Import a prompt version from a file"""
     try:
-        with open(input_file, encoding="utf-8") as f:
+        with open(input_file, encoding="utf-8", buffering=FILE_BUFFER_SIZE) as f:
             prompt_text = f.read()
 
         if add_prompt_version(
-            version_manager, prompt_name, version, prompt_text, description
+            version_manager,
+            prompt_name,
+            version,
+            prompt_text,
+            description,
+            activate=activate,
         ):
             print(f"✅ Imported {prompt_name} v{version} from {input_file}")
         else:
@@ -163,30 +200,13 @@ def test_prompt_version(
         print(f"❌ Error formatting prompt: {e}")
 
 
-def main():
-    """Main CLI function"""
-    parser = argparse.ArgumentParser(
-        description="Manage prompt versions and analytics",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s list                                    # List all prompts
-  %(prog)s add SECTION_WRITER_PROMPT v2.0 "..."   # Add new version
-  %(prog)s set-active SECTION_WRITER_PROMPT v2.0   # Set active version
-  %(prog)s analytics                               # Show all analytics
-  %(prog)s analytics -p SECTION_WRITER_PROMPT     # Show specific prompt analytics
-  %(prog)s export SECTION_WRITER_PROMPT v2.0 prompt.txt  # Export version
-  %(prog)s import SECTION_WRITER_PROMPT v2.1 prompt.txt  # Import version
-  %(prog)s test SECTION_WRITER_PROMPT v2.0 "AI in healthcare"  # Test version
-        """,
-    )
-
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # List command
+def _add_list_parser(subparsers):
+    """Register the list command"""
     subparsers.add_parser("list", help="List all prompts and versions")
 
-    # Add command
+
+def _add_add_parser(subparsers):
+    """Register the add command"""
     add_parser = subparsers.add_parser("add", help="Add a new prompt version")
     add_parser.add_argument("prompt_name", help="Name of the prompt")
     add_parser.add_argument("version", help="Version identifier")
@@ -196,17 +216,26 @@ Examples:
     add_parser.add_argument(
         "-d", "--description", default="", help="Version description"
     )
+    add_parser.add_argument(
+        "-a", "--activate", action="store_true", help="Set as active version"
+    )
+
 
-    # Set active command
+def _add_set_active_parser(subparsers):
+    """Register the set-active command"""
     set_parser = subparsers.add_parser("set-active", help="Set active version")
     set_parser.add_argument("prompt_name", help="Name of the prompt")
     set_parser.add_argument("version", help="Version to set as active")
 
-    # Analytics command
+
+def _add_analytics_parser(subparsers):
+    """Register the analytics command"""
     analytics_parser = subparsers.add_parser("analytics", help="Show analytics")
     analytics_parser.add_argument("-p", "--prompt", help="Specific prompt to analyze")
 
-    # Export command
+
+def _add_export_parser(subparsers):
+    """Register the export command"""
     export_parser = subparsers.add_parser(
         "export", help="Export prompt version to file"
     )
@@ -214,7 +243,9 @@ Examples:
     export_parser.add_argument("version", help="Version to export")
     export_parser.add_argument("output_file", help="Output file path")
 
-    # Import command
+
+def _add_import_parser(subparsers):
+    """Register the import command"""
     import_parser = subparsers.add_parser(
         "import", help="Import prompt version from file"
     )
@@ -224,23 +255,153 @@ Examples:
     import_parser.add_argument(
         "-d", "--description", default="Imported version", help="Version description"
     )
+    import_parser.add_argument(
+        "-a", "--activate", action="store_true", help="Set as active version"
+    )
 
-    # Test command
+
+def _add_test_parser(subparsers):
+    """Register the test command"""
     test_parser = subparsers.add_parser("test", help="Test a prompt version")
     test_parser.add_argument("prompt_name", help="Name of the prompt")
     test_parser.add_argument("version", help="Version to test")
     test_parser.add_argument("test_input", help="Test input (e.g., topic)")
 
-    args = parser.parse_args()
 
-    if not args.command:
-        parser.print_help()
-        return
+# Command name -> function registering its subparser, in help order
+SUBCOMMAND_PARSERS = {
+    "list": _add_list_parser,
+    "add": _add_add_parser,
+    "set-active": _add_set_active_parser,
+    "analytics": _add_analytics_parser,
+    "export": _add_export_parser,
+    "import": _add_import_parser,
+    "test": _add_test_parser,
+}
+
+# Options shared by the commands that add a version
+_ADD_OPTIONS = {
+    "-d": "description",
+    "--description": "description",
+    "-a": "activate",
+    "--activate": "activate",
+}
+
+# Command name -> (positional argument names, {option flag: dest}, option defaults);
+# options defaulting to a bool are switches that take no value
+COMMAND_ARGS = {
+    "list": ((), {}, {}),
+    "add": (
+        ("prompt_name", "version", "prompt_text"),
+        _ADD_OPTIONS,
+        {"description": "", "activate": False},
+    ),
+    "set-active": (("prompt_name", "version"), {}, {}),
+    "analytics": ((), {"-p": "prompt", "--prompt": "prompt"}, {"prompt": None}),
+    "export": (("prompt_name", "version", "output_file"), {}, {}),
+    "import": (
+        ("prompt_name", "version", "input_file"),
+        _ADD_OPTIONS,
+        {"description": "Imported version", "activate": False},
+    ),
+    "test": (("prompt_name", "version", "test_input"), {}, {}),
+}
+
+
+def parse_command_line(argv) -> Optional[argparse.Namespace]:
+    """
+    Parse well-formed command lines without building the argparse parser
+
+    Args:
+        argv: Command line arguments, excluding the program name
+
+    Returns:
+        Parsed arguments, or None when argparse should handle the command line
+        (help, unknown commands, abbreviated options or usage errors)
+    """
+    if not argv or argv[0] not in COMMAND_ARGS:
+        return None
+
+    names, options, defaults = COMMAND_ARGS[argv[0]]
+    values = dict(defaults)
+    positionals = []
+    remaining = iter(argv[1:])
+    for arg in remaining:
+        if not arg.startswith("-") or arg == "-":
+            positionals.append(arg)
+            continue
+        flag, has_value, value = arg.partition("=")
+        dest = options.get(flag)
+        if dest is None:
+            return None
+        if isinstance(defaults[dest], bool):
+            if has_value:
+                return None
+            value = True
+        elif not has_value:
+            value = next(remaining, None)
+            if value is None or value.startswith("-"):
+                return None
+        values[dest] = value
+
+    if len(positionals) != len(names):
+        return None
+    values.update(zip(names, positionals))
+    return argparse.Namespace(command=argv[0], **values)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the full argparse parser, used for help and usage errors"""
+    parser = argparse.ArgumentParser(
+        description="Manage prompt versions and analytics",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s list                                    # List all prompts
+  %(prog)s add SECTION_WRITER_PROMPT v2.0 "..."   # Add new version
+  %(prog)s set-active SECTION_WRITER_PROMPT v2.0   # Set active version
+  %(prog)s analytics                               # Show all analytics
+  %(prog)s analytics -p SECTION_WRITER_PROMPT     # Show specific prompt analytics
+  %(prog)s export SECTION_WRITER_PROMPT v2.0 prompt.txt  # Export version
+  %(prog)s import SECTION_WRITER_PROMPT v2.1 prompt.txt -a  # Import and activate
+  %(prog)s test SECTION_WRITER_PROMPT v2.0 "AI in healthcare"  # Test version
+        """,
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Only build the requested command's parser; help, errors and unknown
+    # commands get all of them so usage text stays complete
+    requested = sys.argv[1] if len(sys.argv) > 1 else None
+    if requested in SUBCOMMAND_PARSERS:
+        SUBCOMMAND_PARSERS[requested](subparsers)
+    else:
+        for add_subcommand_parser in SUBCOMMAND_PARSERS.values():
+            add_subcommand_parser(subparsers)
+
+    return parser
+
+
+def main():
+    """Main CLI function"""
+    args = parse_command_line(sys.argv[1:])
+    if args is None:
+        parser = build_parser()
+        args = parser.parse_args()
+
+        if not args.command:
+            parser.print_help()
+            return
+
+    # Names are used as version-manager dict keys; intern them like the keys
+    for name in ("prompt_name", "version", "prompt"):
+        value = getattr(args, name, None)
+        if isinstance(value, str):
+            setattr(args, name, sys.intern(value))
 
     # Initialize version manager
     try:
-        config = get_config()
-        version_manager = get_prompt_version_manager(config.settings)
+        _, version_manager = _load()
     except Exception as e:
         print(f"❌ Failed to initialize prompt versioning: {e}")
         return
@@ -257,6 +418,7 @@ Examples:
                 args.version,
                 args.prompt_text,
                 args.description,
+                activate=args.activate or None,
             )
 
         elif args.command == "set-active":
@@ -277,6 +439,7 @@ Examples:
                 args.version,
                 args.input_file,
                 args.description,
+                activate=args.activate or None,
             )
 
         elif args.command == "test":
@@ -286,7 +449,7 @@ Examples:
 
         else:
             print(f"❌ Unknown command: {args.command}")
-            parser.print_help()
+            build_parser().print_help()
 
     except KeyboardInterrupt:
         print("\n⚠️ Operation cancelled by user")
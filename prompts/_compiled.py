@@ -0,0 +1,40 @@
+"""
+Compiled prompt templates
+Parses str.format-style prompts once so repeated renders skip the parsing
+"""
+
+from functools import lru_cache
+import string
+from typing import Any, Callable
+
+
+@lru_cache(maxsize=256)
+def compile_prompt_template(template: str) -> Callable[..., str]:
+    """
+    Compile a str.format-style prompt into a reusable render function
+
+    Plain ``{name}`` fields are rewritten once into a printf-style template so
+    each render is a single substitution; anything fancier (format specs,
+    conversions, attribute/index access) falls back to ``str.format``.
+
+    Args:
+        template: Prompt text using ``{field}`` placeholders and ``{{ }}`` escapes
+
+    Returns:
+        Function taking the fields as keyword arguments and returning the text
+    """
+    parts = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        parts.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if format_spec or conversion or not field.isidentifier():
+            return template.format
+        parts.append(f"%({field})s")
+
+    compiled = "".join(parts)
+
+    def render(**fields: Any) -> str:
+        return compiled % fields
+
+    return render
@@ -3,22 +3,54 @@ Report Planning Prompts
 Prompts for planning report structure and generating search queries
 """
 
-REPORT_STRUCTURE_PROMPT = """Plan a comprehensive research report on: {topic}
-
-Create a report structure with 4-6 sections following this template:
-- Introduction (brief overview, no research needed)
-- 2-4 main content sections (each needs research)
-- Conclusion (summary and insights, no research needed)
-
-Return ONLY valid JSON in this exact format:
-{{
-    "title": "Professional report title for {topic}",
-    "sections": [
-        {{"title": "Introduction", "description": "Brief overview of the topic", "needs_research": false}},
-        {{"title": "Section Name", "description": "What this section covers", "needs_research": true}},
-        {{"title": "Conclusion", "description": "Summary and key insights", "needs_research": false}}
-    ]
-}}"""
+from types import MappingProxyType
+from typing import Any
+
+from ._compiled import compile_prompt_template
+
+# Shared by the structure prompts: JSON return instruction and section entries
+_JSON_RETURN_HEADER = "Return ONLY valid JSON in this exact format:\n"
+_SECTION_ENTRY = (
+    '        {{{{"title": "{}", "description": "{}", "needs_research": {}}}}}'
+)
+
+
+def _structure_prompt(intro: str, outline: str, title: str, sections) -> str:
+    """
+    Compose a structure planning template from its parts
+
+    Args:
+        intro: Opening instructions, ending with the section outline heading
+        outline: Bullet list of the planned sections
+        title: Report title placeholder text
+        sections: (title, description, needs_research) tuples for the example
+
+    Returns:
+        Template text with {topic} left as a format field
+    """
+    entries = ",\n".join(
+        _SECTION_ENTRY.format(name, description, "true" if research else "false")
+        for name, description, research in sections
+    )
+    return (
+        f"{intro}\n{outline}\n\n{_JSON_RETURN_HEADER}"
+        f'{{{{\n    "title": "{title}",\n    "sections": [\n{entries}\n    ]\n}}}}'
+    )
+
+
+REPORT_STRUCTURE_PROMPT = _structure_prompt(
+    "Plan a comprehensive research report on: {topic}\n\n"
+    "Create a report structure with 4-6 sections following this template:",
+    "- Introduction (brief overview, no research needed)\n"
+    "- 2-4 main content sections (each needs research)\n"
+    "- Conclusion (summary and insights, no research needed)",
+    "Professional report title for {topic}",
+    [
+        ("Introduction", "Brief overview of the topic", False),
+        ("Section Name", "What this section covers", True),
+        ("Conclusion", "Summary and key insights", False),
+    ],
+)
 
 QUERY_GENERATION_PROMPT = """Generate 3-4 specific web search queries for researching this section:
 
@@ -35,47 +67,94 @@ Requirements:
 Return ONLY a JSON array of strings:
 ["query 1", "query 2", "query 3"]"""
 
+BULK_QUERY_GENERATION_PROMPT = """Generate 3-4 specific web search queries for each of these report sections:
+
+Overall Topic: {topic}
+
+Sections:
+{sections}
+
+Requirements:
+- Queries should be specific and targeted
+- Include recent year (2024/2025) where relevant
+- Focus on authoritative sources
+- Avoid overly broad queries
+
+Return ONLY a JSON object mapping each section title, exactly as written above, to an array of query strings:
+{{"Section title": ["query 1", "query 2", "query 3"]}}"""
+
 # Alternative planning templates
-BUSINESS_STRUCTURE_PROMPT = """Plan a business analysis report on: {topic}
-
-Create a business-focused structure with these sections:
-- Executive Summary (no research needed)
-- Market Overview (needs research)
-- Competitive Analysis (needs research)
-- Key Trends & Opportunities (needs research)
-- Strategic Recommendations (no research needed)
-
-Return ONLY valid JSON in this exact format:
-{{
-    "title": "Business Analysis: {topic}",
-    "sections": [
-        {{"title": "Executive Summary", "description": "High-level overview and key findings", "needs_research": false}},
-        {{"title": "Market Overview", "description": "Current market size, growth, and dynamics", "needs_research": true}},
-        {{"title": "Competitive Analysis", "description": "Key players and competitive landscape", "needs_research": true}},
-        {{"title": "Key Trends & Opportunities", "description": "Emerging trends and market opportunities", "needs_research": true}},
-        {{"title": "Strategic Recommendations", "description": "Actionable insights and next steps", "needs_research": false}}
-    ]
-}}"""
-
-ACADEMIC_STRUCTURE_PROMPT = """Plan an academic research report on: {topic}
-
-Create an academic-style structure with these sections:
-- Abstract (no research needed)
-- Introduction & Background (needs research)
-- Literature Review (needs research)
-- Current Research & Findings (needs research)
-- Discussion & Analysis (needs research)
-- Conclusion & Future Directions (no research needed)
-
-Return ONLY valid JSON in this exact format:
-{{
-    "title": "Academic Review: {topic}",
-    "sections": [
-        {{"title": "Abstract", "description": "Summary of the research and key findings", "needs_research": false}},
-        {{"title": "Introduction & Background", "description": "Context and foundational knowledge", "needs_research": true}},
-        {{"title": "Literature Review", "description": "Review of existing research and publications", "needs_research": true}},
-        {{"title": "Current Research & Findings", "description": "Latest research developments and discoveries", "needs_research": true}},
-        {{"title": "Discussion & Analysis", "description": "Analysis of findings and implications", "needs_research": true}},
-        {{"title": "Conclusion & Future Directions", "description": "Summary and future research directions", "needs_research": false}}
-    ]
-}}"""
+BUSINESS_STRUCTURE_PROMPT = _structure_prompt(
+    "Plan a business analysis report on: {topic}\n\n"
+    "Create a business-focused structure with these sections:",
+    "- Executive Summary (no research needed)\n"
+    "- Market Overview (needs research)\n"
+    "- Competitive Analysis (needs research)\n"
+    "- Key Trends & Opportunities (needs research)\n"
+    "- Strategic Recommendations (no research needed)",
+    "Business Analysis: {topic}",
+    [
+        ("Executive Summary", "High-level overview and key findings", False),
+        ("Market Overview", "Current market size, growth, and dynamics", True),
+        ("Competitive Analysis", "Key players and competitive landscape", True),
+        (
+            "Key Trends & Opportunities",
+            "Emerging trends and market opportunities",
+            True,
+        ),
+        ("Strategic Recommendations", "Actionable insights and next steps", False),
+    ],
+)
+
+ACADEMIC_STRUCTURE_PROMPT = _structure_prompt(
+    "Plan an academic research report on: {topic}\n\n"
+    "Create an academic-style structure with these sections:",
+    "- Abstract (no research needed)\n"
+    "- Introduction & Background (needs research)\n"
+    "- Literature Review (needs research)\n"
+    "- Current Research & Findings (needs research)\n"
+    "- Discussion & Analysis (needs research)\n"
+    "- Conclusion & Future Directions (no research needed)",
+    "Academic Review: {topic}",
+    [
+        ("Abstract", "Summary of the research and key findings", False),
+        ("Introduction & Background", "Context and foundational knowledge", True),
+        ("Literature Review", "Review of existing research and publications", True),
+        (
+            "Current Research & Findings",
+            "Latest research developments and discoveries",
+            True,
+        ),
+        ("Discussion & Analysis", "Analysis of findings and implications", True),
+        (
+            "Conclusion & Future Directions",
+            "Summary and future research directions",
+            False,
+        ),
+    ],
+)
+
+# Prompt name -> template, for lookups by name
+TEMPLATES = MappingProxyType(
+    {
+        "REPORT_STRUCTURE_PROMPT": REPORT_STRUCTURE_PROMPT,
+        "QUERY_GENERATION_PROMPT": QUERY_GENERATION_PROMPT,
+        "BULK_QUERY_GENERATION_PROMPT": BULK_QUERY_GENERATION_PROMPT,
+        "BUSINESS_STRUCTURE_PROMPT": BUSINESS_STRUCTURE_PROMPT,
+        "ACADEMIC_STRUCTURE_PROMPT": ACADEMIC_STRUCTURE_PROMPT,
+    }
+)
+
+# Prompt name -> render function, parsed once at import
+_RENDERERS = {
+    name: compile_prompt_template(template) for name, template in TEMPLATES.items()
+}
+
+
+def render(name: str, **fields: Any) -> str:
+    """Render a prompt by name with the given fields"""
+    return _RENDERERS[name](**fields)
+
+
+# Star-imported by the package: export the prompt constants only
+__all__ = list(TEMPLATES)
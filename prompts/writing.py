@@ -3,6 +3,11 @@ Content Writing Prompts
 Prompts for writing different types of report sections
 """
 
+from types import MappingProxyType
+from typing import Any
+
+from ._compiled import compile_prompt_template
+
 SECTION_WRITER_PROMPT = """Write a comprehensive section for a research report.
 
 Section Title: {section_title}
@@ -157,3 +162,31 @@ Available Technical Sources:
 {sources}
 
 Write the technical overview section now:"""
+
+# Prompt name -> template, for lookups by name
+TEMPLATES = MappingProxyType(
+    {
+        "SECTION_WRITER_PROMPT": SECTION_WRITER_PROMPT,
+        "INTRODUCTION_WRITER_PROMPT": INTRODUCTION_WRITER_PROMPT,
+        "CONCLUSION_WRITER_PROMPT": CONCLUSION_WRITER_PROMPT,
+        "BUSINESS_EXECUTIVE_SUMMARY_PROMPT": BUSINESS_EXECUTIVE_SUMMARY_PROMPT,
+        "BUSINESS_RECOMMENDATIONS_PROMPT": BUSINESS_RECOMMENDATIONS_PROMPT,
+        "ACADEMIC_ABSTRACT_PROMPT": ACADEMIC_ABSTRACT_PROMPT,
+        "ACADEMIC_LITERATURE_REVIEW_PROMPT": ACADEMIC_LITERATURE_REVIEW_PROMPT,
+        "TECHNICAL_OVERVIEW_PROMPT": TECHNICAL_OVERVIEW_PROMPT,
+    }
+)
+
+# Prompt name -> render function, parsed once at import
+_RENDERERS = {
+    name: compile_prompt_template(template) for name, template in TEMPLATES.items()
+}
+
+
+def render(name: str, **fields: Any) -> str:
+    """Render a prompt by name with the given fields"""
+    return _RENDERERS[name](**fields)
+
+
+# Star-imported by the package: export the prompt constants only
+__all__ = list(TEMPLATES)
@@ -5,17 +5,26 @@ Clean separation of logic and content for better maintainability
 """
 
 import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
 import os
-from typing import Any, Dict, List
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 from dotenv import load_dotenv
-from pydantic import BaseModel
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient
 
 # Import our custom modules
 from config import ReportConfig, get_config
-from utils.json_parser import parse_report_plan, parse_search_queries
+from utils.batch_dispatcher import get_batch_dispatcher
+from utils.event_loop import run
+from utils.json_parser import (
+    parse_bulk_search_queries,
+    parse_report_plan,
+    parse_search_queries,
+)
 from utils.observability import (
     ComponentType,
     OperationType,
@@ -25,44 +34,162 @@ from utils.observability import (
 )
 from utils.prompt_loader import PromptLoader
 from utils.rate_limiter import get_rate_limiter
+from utils.response_cache import create_response_cache
 from utils.search_cache import create_search_cache
+from utils.semantic_cache import SemanticCache, create_semantic_cache
 from utils.token_manager import create_token_manager
 
 # Load environment variables
 load_dotenv()
 
+# Claude caches prompts of at least ~1024 tokens; shorter ones are not marked
+MIN_CACHEABLE_PROMPT_CHARS = 4096
+
+# Plan title and (title, description, needs_research) sections used when
+# planning fails, by template
+FALLBACK_PLANS = {
+    "business": (
+        "Business Analysis: {topic}",
+        (
+            ("Executive Summary", "Overview of {topic}", False),
+            ("Market Analysis", "Market analysis of {topic}", True),
+            ("Strategic Recommendations", "Recommendations", False),
+        ),
+    ),
+    "academic": (
+        "Academic Review: {topic}",
+        (
+            ("Abstract", "Abstract for {topic}", False),
+            ("Literature Review", "Literature review of {topic}", True),
+            ("Conclusion", "Conclusions", False),
+        ),
+    ),
+    "default": (
+        "Research Report: {topic}",
+        (
+            ("Introduction", "Overview of {topic}", False),
+            ("Main Analysis", "Core analysis of {topic}", True),
+            ("Conclusion", "Summary and insights", False),
+        ),
+    ),
+}
+
+# Title keywords -> section type, checked in order; the first match wins
+SECTION_TYPE_KEYWORDS = (
+    (("intro",), "introduction"),
+    (("conclusion",), "conclusion"),
+    (("executive", "summary"), "executive_summary"),
+    (("literature", "review"), "literature_review"),
+    (("abstract",), "abstract"),
+    (("recommendation",), "recommendations"),
+    (("technical", "architecture"), "technical_overview"),
+)
+
+
+@lru_cache(maxsize=256)
+def determine_section_type(section_title: str) -> str:
+    """Classify a section by keywords in its title"""
+    title_lower = section_title.lower()
+    return next(
+        (
+            section_type
+            for keywords, section_type in SECTION_TYPE_KEYWORDS
+            if any(keyword in title_lower for keyword in keywords)
+        ),
+        "default",
+    )
 
-class Section(BaseModel):
+
+# slots=True needs Python 3.10+; older interpreters get regular dataclasses
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Section:
     title: str
     description: str
     needs_research: bool = True
     content: str = ""
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Section":
+        """Build a section from parsed plan JSON, ignoring unknown keys"""
+        return cls(
+            title=data["title"],
+            description=data["description"],
+            needs_research=data.get("needs_research", True),
+            content=data.get("content", ""),
+        )
+
 
-class ReportPlan(BaseModel):
+@dataclass(**_DATACLASS_OPTIONS)
+class ReportPlan:
     title: str
-    sections: List[Section]
+    sections: List[Section] = field(default_factory=list)
+
+
+def create_anthropic_client(config: ReportConfig) -> AsyncAnthropic:
+    """Create an Anthropic client that generators can share"""
+    # The rate limiter already retries; SDK retries on top multiply attempts
+    max_retries = 0 if config.get("enable_retries", True) else 2
+    return AsyncAnthropic(
+        api_key=os.getenv("ANTHROPIC_API_KEY"), max_retries=max_retries
+    )
+
+
+def create_tavily_client() -> AsyncTavilyClient:
+    """Create a Tavily client that generators can share"""
+    return AsyncTavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
+
+
+async def close_tavily_client(client: AsyncTavilyClient) -> None:
+    """Close a Tavily client's connection pool"""
+    close = getattr(client, "close", None)  # Older clients have none
+    if close is not None:
+        await close()
 
 
 class ImprovedReportGenerator:
     """Improved report generator with configurable prompts and templates"""
 
-    def __init__(self, config: ReportConfig = None):
-        """Initialize with optional configuration"""
+    def __init__(
+        self,
+        config: ReportConfig = None,
+        anthropic_client: AsyncAnthropic = None,
+        tavily_client: AsyncTavilyClient = None,
+    ):
+        """
+        Initialize with optional configuration
+
+        Args:
+            config: Report configuration, defaults to the standard preset
+            anthropic_client: Shared Anthropic client; the caller closes it
+            tavily_client: Shared Tavily client; the caller closes it
+        """
         self.config = config or get_config("standard")
-        self.prompt_loader = PromptLoader(self.config)
+        self.prompt_loader = PromptLoader.for_config(self.config)
 
         # Initialize structured logging
         self.logger = get_logger(ComponentType.REPORT_GENERATOR)
         self.obs = get_observability_manager()
 
-        # Initialize API clients
-        self.anthropic = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-        self.tavily = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
+        # Initialize API clients; the async clients keep their connections open
+        self._owns_anthropic = anthropic_client is None
+        self._owns_tavily = tavily_client is None
+        self.anthropic = anthropic_client or create_anthropic_client(self.config)
+        self.tavily = tavily_client or create_tavily_client()
 
         # Initialize rate limiter
         self.rate_limiter = get_rate_limiter(self.config.settings)
 
+        # Batch mode sends Claude requests through the Message Batches API
+        if self.config.get("batch_mode", False):
+            self.batch_dispatcher = get_batch_dispatcher(
+                self.anthropic, self.config.settings
+            )
+        else:
+            self.batch_dispatcher = None
+
         # Initialize token manager
         if self.config.get("enable_token_management", True):
             model_name = self.config.get("token_model_name", self.config.get("model"))
@@ -76,6 +203,18 @@ class ImprovedReportGenerator:
         else:
             self.search_cache = None
 
+        # Initialize exact-match cache for deterministic planning calls
+        if self.config.get("enable_response_cache", True):
+            self.response_cache = create_response_cache(self.config.settings)
+        else:
+            self.response_cache = None
+
+        # Initialize response cache for written sections
+        if self.config.get("enable_semantic_cache", False):
+            self.semantic_cache = create_semantic_cache(self.config.settings)
+        else:
+            self.semantic_cache = None
+
         # Validate API keys
         if not os.getenv("ANTHROPIC_API_KEY"):
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
@@ -85,6 +224,19 @@ class ImprovedReportGenerator:
         # Create output directory
         os.makedirs(self.config.get("output_directory"), exist_ok=True)
 
+    async def __aenter__(self) -> "ImprovedReportGenerator":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the connection pools of the API clients this generator created"""
+        if self._owns_anthropic:
+            await self.anthropic.close()
+        if self._owns_tavily:
+            await close_tavily_client(self.tavily)
+
     @timed_operation(
         "full_report_generation",
         ComponentType.REPORT_GENERATOR,
@@ -111,8 +263,13 @@ class ImprovedReportGenerator:
                 **context,
             )
 
-            # Step 2: Research and write sections
-            for i, section in enumerate(plan.sections, 1):
+            # Step 2: Research and write sections, several at a time
+            # Searches of this report by (normalized query, topic), so sections
+            # asking the same question share one search
+            shared_searches: Dict[Tuple[str, str], "asyncio.Future"] = {}
+            semaphore = asyncio.Semaphore(self.config.get("max_concurrent_sections", 4))
+
+            async def write_section(i: int, section: Section) -> None:
                 section_context = {
                     **context,
                     "section_number": i,
@@ -121,16 +278,20 @@ class ImprovedReportGenerator:
                     "needs_research": section.needs_research,
                 }
 
-                self.logger.info("Starting section work", **section_context)
+                async with semaphore:
+                    self.logger.info("Starting section work", **section_context)
 
-                if section.needs_research:
-                    section.content = await self._research_and_write_section(
-                        section, topic
-                    )
-                else:
-                    section.content = await self._write_contextual_section(
-                        section, plan.sections, topic
-                    )
+                    if section.needs_research:
+                        section.content = await self._research_and_write_section(
+                            section,
+                            topic,
+                            queries_by_title.get(section.title),
+                            shared_searches,
+                        )
+                    else:
+                        section.content = await self._write_contextual_section(
+                            section, context_text, topic
+                        )
 
                 self.logger.info(
                     "Section completed",
@@ -139,6 +300,25 @@ class ImprovedReportGenerator:
                     **section_context,
                 )
 
+            # One request plans the searches for every research section
+            research_sections = [s for s in plan.sections if s.needs_research]
+            context_text = "\n".join(
+                f"- {s.title}: {s.description}" for s in research_sections
+            )
+            queries_by_title = await self._generate_all_search_queries(
+                research_sections, topic
+            )
+
+            # Research sections are independent of each other; contextual
+            # sections only need the plan and run as a second batch
+            numbered = list(enumerate(plan.sections, 1))
+            await asyncio.gather(
+                *(write_section(i, s) for i, s in numbered if s.needs_research)
+            )
+            await asyncio.gather(
+                *(write_section(i, s) for i, s in numbered if not s.needs_research)
+            )
+
             # Step 3: Compile final report
             self.logger.info("Compiling final report", **context)
             final_report = self._compile_report(plan)
@@ -182,6 +362,68 @@ class ImprovedReportGenerator:
             self.logger.error("Report generation failed", error=e, **context)
             raise
 
+    async def _create_message(
+        self, prompt: str, max_tokens: int, cache: bool = False
+    ) -> str:
+        """
+        Send a single-turn prompt to Claude and return the reply text
+
+        Args:
+            prompt: The user message
+            max_tokens: Response token limit
+            cache: Reuse the reply for identical requests at temperature 0
+        """
+        model = self.config.get("model")
+        temperature = self.config.get("temperature", 0)
+
+        cache_key = None
+        if cache and self.response_cache and temperature == 0:
+            cache_key = self.response_cache.make_key(
+                model=model, prompt=prompt, max_tokens=max_tokens
+            )
+            cached_text = self.response_cache.get(cache_key)
+            if cached_text is not None:
+                return cached_text
+
+        content: Any = prompt
+        if (
+            self.config.get("enable_prompt_caching", False)
+            and len(prompt) >= MIN_CACHEABLE_PROMPT_CHARS
+        ):
+            # Retries and repeated runs of the same prompt read it from cache
+            content = [
+                {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}
+            ]
+
+        params = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "messages": [{"role": "user", "content": content}],
+        }
+
+        text = None
+        if self.batch_dispatcher is not None:
+            try:
+                text = await self.batch_dispatcher.create_message(**params)
+            except Exception as e:
+                self.logger.warning(
+                    "Batch request failed, retrying in real time", error=e
+                )
+
+        # Streamed, so concurrent sections overlap their generation phases
+        async def stream_text() -> str:
+            async with self.anthropic.messages.stream(**params) as stream:
+                self.rate_limiter.record_anthropic_headers(stream.response.headers)
+                return "".join([text async for text in stream.text_stream])
+
+        if text is None:
+            text = await self.rate_limiter.call_anthropic_api(stream_text)
+
+        if cache_key is not None:
+            self.response_cache.put(cache_key, text)
+        return text
+
     async def _plan_report(self, topic: str) -> ReportPlan:
         """Create report structure using template-specific prompts"""
 
@@ -189,23 +431,20 @@ class ImprovedReportGenerator:
         prompt = self.prompt_loader.get_structure_prompt(topic)
 
         try:
-            # Create async wrapper for Anthropic API call
-            async def anthropic_call():
-                return self.anthropic.messages.create(
-                    model=self.config.get("model"),
-                    max_tokens=self.config.get("max_tokens", 1500),
-                    temperature=self.config.get("temperature", 0),
-                    messages=[{"role": "user", "content": prompt}],
-                )
-
-            response = await self.rate_limiter.call_anthropic_api(anthropic_call)
+            content = await self._create_message(
+                prompt, self.config.get("max_tokens", 1500), cache=True
+            )
 
             # Extract JSON from response using robust parser
-            content = response.content[0].text
             plan_data = parse_report_plan(content)
 
             if plan_data:
-                return ReportPlan(**plan_data)
+                return ReportPlan(
+                    title=plan_data["title"],
+                    sections=[
+                        Section.from_dict(section) for section in plan_data["sections"]
+                    ],
+                )
             else:
                 raise ValueError("Failed to parse report plan JSON")
 
@@ -220,87 +459,92 @@ class ImprovedReportGenerator:
 
     def _create_fallback_plan(self, topic: str) -> ReportPlan:
         """Create a fallback plan if JSON parsing fails"""
-        template = self.config.get_prompt_template()
-
-        if template == "business":
-            return ReportPlan(
-                title=f"Business Analysis: {topic}",
-                sections=[
-                    Section(
-                        title="Executive Summary",
-                        description=f"Overview of {topic}",
-                        needs_research=False,
-                    ),
-                    Section(
-                        title="Market Analysis",
-                        description=f"Market analysis of {topic}",
-                        needs_research=True,
-                    ),
-                    Section(
-                        title="Strategic Recommendations",
-                        description="Recommendations",
-                        needs_research=False,
-                    ),
-                ],
-            )
-        elif template == "academic":
-            return ReportPlan(
-                title=f"Academic Review: {topic}",
-                sections=[
-                    Section(
-                        title="Abstract",
-                        description=f"Abstract for {topic}",
-                        needs_research=False,
-                    ),
-                    Section(
-                        title="Literature Review",
-                        description=f"Literature review of {topic}",
-                        needs_research=True,
-                    ),
-                    Section(
-                        title="Conclusion",
-                        description="Conclusions",
-                        needs_research=False,
-                    ),
-                ],
-            )
-        else:
-            return ReportPlan(
-                title=f"Research Report: {topic}",
-                sections=[
-                    Section(
-                        title="Introduction",
-                        description=f"Overview of {topic}",
-                        needs_research=False,
-                    ),
-                    Section(
-                        title="Main Analysis",
-                        description=f"Core analysis of {topic}",
-                        needs_research=True,
-                    ),
-                    Section(
-                        title="Conclusion",
-                        description="Summary and insights",
-                        needs_research=False,
-                    ),
-                ],
-            )
-
-    async def _research_and_write_section(self, section: Section, topic: str) -> str:
-        """Research and write a section using configured prompts"""
+        title_format, sections = FALLBACK_PLANS.get(
+            self.config.get_prompt_template(), FALLBACK_PLANS["default"]
+        )
+        return ReportPlan(
+            title=title_format.format(topic=topic),
+            sections=[
+                Section(
+                    title=title,
+                    description=description.format(topic=topic),
+                    needs_research=needs_research,
+                )
+                for title, description, needs_research in sections
+            ],
+        )
 
-        # Generate search queries using prompt loader
-        queries = await self._generate_search_queries(section, topic)
+    async def _research_and_write_section(
+        self,
+        section: Section,
+        topic: str,
+        queries: Optional[List[str]] = None,
+        shared_searches: Optional[Dict[Tuple[str, str], "asyncio.Future"]] = None,
+    ) -> str:
+        """Research and write a section, generating queries if none are given"""
 
         # Determine section type for caching
         section_type = self._determine_section_type(section.title)
 
+        # A cached answer to a near-identical request skips research entirely
+        cached_content = self._get_cached_section(section, topic, section_type)
+        if cached_content:
+            return cached_content
+
+        # Generate search queries using prompt loader
+        if not queries:
+            queries = await self._generate_search_queries(section, topic)
+
         # Search the web with caching
-        search_results = await self._search_web(queries, topic, section_type)
+        search_results = await self._search_web(
+            queries, topic, section_type, shared_searches
+        )
 
         # Write section based on research using appropriate prompt
         return await self._write_section_with_sources(section, search_results, topic)
 
+    async def _generate_all_search_queries(
+        self, sections: List[Section], topic: str
+    ) -> Dict[str, List[str]]:
+        """
+        Generate search queries for several sections in a single request
+
+        Returns:
+            Section title -> queries; sections missing from the reply are left
+            out so they fall back to per-section generation
+        """
+        if not sections:
+            return {}
+
+        prompt = self.prompt_loader.get_bulk_query_generation_prompt(
+            topic, [(s.title, s.description) for s in sections]
+        )
+
+        try:
+            content = await self._create_message(
+                prompt, 500 * len(sections), cache=True
+            )
+            queries = parse_bulk_search_queries(content)
+            if not queries:
+                raise ValueError("Failed to parse bulk search queries JSON")
+
+        except Exception as e:
+            self.logger.warning(
+                "Bulk search query generation failed, using per-section queries",
+                error=e,
+                topic=topic,
+            )
+            return {}
+
+        # Match titles loosely, as the model may re-case or re-space them
+        by_title = {" ".join(t.lower().split()): q for t, q in queries.items()}
+        matched = {}
+        for section in sections:
+            key = " ".join(section.title.lower().split())
+            if key in by_title:
+                matched[section.title] = by_title[key]
+        return matched
+
     async def _generate_search_queries(self, section: Section, topic: str) -> List[str]:
         """Generate targeted search queries using prompt loader"""
 
@@ -309,18 +553,7 @@ class ImprovedReportGenerator:
         )
 
         try:
-            # Create async wrapper for Anthropic API call
-            async def anthropic_call():
-                return self.anthropic.messages.create(
-                    model=self.config.get("model"),
-                    max_tokens=500,
-                    temperature=self.config.get("temperature", 0),
-                    messages=[{"role": "user", "content": prompt}],
-                )
-
-            response = await self.rate_limiter.call_anthropic_api(anthropic_call)
-
-            content = response.content[0].text
+            content = await self._create_message(prompt, 500, cache=True)
             queries = parse_search_queries(content)
 
             if queries:
@@ -338,18 +571,46 @@ class ImprovedReportGenerator:
             return [f"{topic} {section.title}", f"{section.description} 2024"]
 
     async def _search_web(
-        self, queries: List[str], topic: str = "", section_type: str = ""
+        self,
+        queries: List[str],
+        topic: str = "",
+        section_type: str = "",
+        shared_searches: Optional[Dict[Tuple[str, str], "asyncio.Future"]] = None,
     ) -> List[Dict[str, Any]]:
-        """Search web using Tavily with intelligent caching"""
+        """
+        Search web using Tavily with intelligent caching
+
+        Args:
+            shared_searches: In-flight searches of the current report, shared
+                between its sections; searches are not shared when omitted
+        """
+        if shared_searches is None:
+            shared_searches = {}
 
-        all_results = []
         max_results = self.config.get("max_search_results", 4)
         search_depth = self.config.get("search_depth", "advanced")
+        include_raw_content = self.config.get("search_include_raw_content", False)
 
         cache_hits = 0
         cache_misses = 0
 
-        for query in queries:
+        async def search_query(query: str) -> List[Dict[str, Any]]:
+            nonlocal cache_hits
+            # Sections often ask the same question; run each search only once
+            key = (" ".join(query.lower().split()), topic)
+            search = shared_searches.get(key)
+            if search is None:
+                search = asyncio.ensure_future(fetch_query(query))
+                shared_searches[key] = search
+            else:
+                cache_hits += 1
+                self.logger.debug(
+                    "Reusing search from another section", query=query, topic=topic
+                )
+            return await asyncio.shield(search)
+
+        async def fetch_query(query: str) -> List[Dict[str, Any]]:
+            nonlocal cache_hits, cache_misses
             try:
                 # Check cache first if enabled
                 if self.search_cache:
@@ -365,8 +626,7 @@ class ImprovedReportGenerator:
                             section_type=section_type,
                             results_count=len(cached_results),
                         )
-                        all_results.extend(cached_results)
-                        continue
+                        return cached_results
 
                 # Cache miss - make API call
                 cache_misses += 1
@@ -377,26 +637,26 @@ class ImprovedReportGenerator:
                     section_type=section_type,
                 )
 
-                # Create async wrapper for Tavily API call
                 async def tavily_call():
-                    return self.tavily.search(
+                    return await self.tavily.search(
                         query=query,
                         search_depth=search_depth,
                         max_results=max_results,
-                        include_raw_content=True,
+                        include_raw_content=include_raw_content,
                     )
 
                 results = await self.rate_limiter.call_tavily_api(tavily_call)
 
-                if "results" in results:
-                    query_results = results["results"]
-                    all_results.extend(query_results)
+                if "results" not in results:
+                    return []
+                query_results = results["results"]
 
-                    # Cache the results if caching is enabled
-                    if self.search_cache:
-                        self.search_cache.cache_results(
-                            query, query_results, topic, section_type
-                        )
+                # Cache the results if caching is enabled
+                if self.search_cache:
+                    self.search_cache.cache_results(
+                        query, query_results, topic, section_type
+                    )
+                return query_results
 
             except Exception as e:
                 self.logger.warning(
@@ -406,9 +666,13 @@ class ImprovedReportGenerator:
                     topic=topic,
                     section_type=section_type,
                 )
-                continue
+                return []
 
-                # Log cache performance if enabled
+        # Run all queries at once; results keep the order of the queries
+        results_per_query = await asyncio.gather(*map(search_query, queries))
+        all_results = [result for results in results_per_query for result in results]
+
+        # Log cache performance if enabled
         if self.search_cache and self.config.get("cache_reporting", True):
             self.logger.info(
                 "Search cache performance",
@@ -420,18 +684,15 @@ class ImprovedReportGenerator:
                 else 0,
             )
 
-        # Remove duplicates and limit results
-        seen_urls = set()
-        unique_results = []
-
+        # Remove duplicates (first result per URL, in order) and limit results
+        total_limit = self.config.get("total_source_limit", 12)
+        unique_results: Dict[str, Dict[str, Any]] = {}
         for result in all_results:
-            url = result.get("url", "")
-            if url not in seen_urls:
-                seen_urls.add(url)
-                unique_results.append(result)
+            if len(unique_results) >= total_limit:
+                break
+            unique_results.setdefault(result.get("url", ""), result)
 
-        total_limit = self.config.get("total_source_limit", 12)
-        return unique_results[:total_limit]
+        return list(unique_results.values())
 
     async def _write_section_with_sources(
         self, section: Section, search_results: List[Dict], topic: str
@@ -441,9 +702,12 @@ class ImprovedReportGenerator:
         # Determine section type for appropriate prompting
         section_type = self._determine_section_type(section.title)
 
-        # Get the appropriate writing prompt (without sources first)
-        initial_prompt = self.prompt_loader.get_section_writing_prompt(
-            section.title, section.description, topic, "", section_type
+        # Render the writing prompt once; sources go between the two parts
+        (
+            before_sources,
+            after_sources,
+        ) = self.prompt_loader.get_section_writing_prompt_parts(
+            section.title, section.description, topic, section_type
         )
 
         # Optimize sources for context window if token management is enabled
@@ -452,7 +716,7 @@ class ImprovedReportGenerator:
                 optimized_sources,
                 token_usage,
             ) = self.token_manager.optimize_sources_for_context(
-                search_results, initial_prompt
+                search_results, before_sources + after_sources
             )
             sources_text = self.token_manager.format_optimized_sources(
                 optimized_sources
@@ -480,23 +744,14 @@ class ImprovedReportGenerator:
             sources_text = self._format_sources(search_results)
 
         # Get the final prompt with optimized sources
-        prompt = self.prompt_loader.get_section_writing_prompt(
-            section.title, section.description, topic, sources_text, section_type
-        )
+        prompt = before_sources + sources_text + after_sources
 
         try:
-            # Create async wrapper for Anthropic API call
-            async def anthropic_call():
-                return self.anthropic.messages.create(
-                    model=self.config.get("model"),
-                    max_tokens=self.config.get("max_tokens", 2000),
-                    temperature=self.config.get("temperature", 0),
-                    messages=[{"role": "user", "content": prompt}],
-                )
-
-            response = await self.rate_limiter.call_anthropic_api(anthropic_call)
-
-            return response.content[0].text
+            content = await self._create_message(
+                prompt, self.config.get("max_tokens", 2000)
+            )
+            self._cache_section(section, topic, section_type, content)
+            return content
 
         except Exception as e:
             self.logger.error(
@@ -509,12 +764,12 @@ class ImprovedReportGenerator:
 
     def _format_sources(self, search_results: List[Dict]) -> str:
         """Format search results for prompt inclusion (fallback method)"""
-        sources_text = ""
         max_sources = self.config.get("max_sources_per_section", 8)
 
         # Use configurable source content limit
         max_source_content = self.config.get("token_max_source_content", 500)
 
+        parts = []
         for i, result in enumerate(search_results[:max_sources], 1):
             title = result.get("title", "Unknown")
             content = result.get("content", result.get("raw_content", ""))[
@@ -522,62 +777,35 @@ class ImprovedReportGenerator:
             ]
             url = result.get("url", "")
 
-            sources_text += (
-                f"\nSource {i}: {title}\nURL: {url}\nContent: {content}\n---"
-            )
+            parts.append(f"\nSource {i}: {title}\nURL: {url}\nContent: {content}\n---")
 
-        return sources_text
+        return "".join(parts)
 
     def _determine_section_type(self, section_title: str) -> str:
         """Determine section type for appropriate prompt selection"""
-        title_lower = section_title.lower()
-
-        if "intro" in title_lower:
-            return "introduction"
-        elif "conclusion" in title_lower:
-            return "conclusion"
-        elif "executive" in title_lower or "summary" in title_lower:
-            return "executive_summary"
-        elif "literature" in title_lower or "review" in title_lower:
-            return "literature_review"
-        elif "abstract" in title_lower:
-            return "abstract"
-        elif "recommendation" in title_lower:
-            return "recommendations"
-        elif "technical" in title_lower or "architecture" in title_lower:
-            return "technical_overview"
-        else:
-            return "default"
+        return determine_section_type(section_title)
 
     async def _write_contextual_section(
-        self, section: Section, all_sections: List[Section], topic: str
+        self, section: Section, context_text: str, topic: str
     ) -> str:
-        """Write intro/conclusion using contextual prompts"""
-
-        context_sections = [s for s in all_sections if s.needs_research]
-        context_text = "\n".join(
-            [f"- {s.title}: {s.description}" for s in context_sections]
-        )
+        """Write intro/conclusion from the research sections' outline"""
 
         section_type = self._determine_section_type(section.title)
 
+        cached_content = self._get_cached_section(
+            section, topic, section_type, context_text
+        )
+        if cached_content:
+            return cached_content
+
         prompt = self.prompt_loader.get_contextual_section_prompt(
             section.title, section.description, topic, context_text, section_type
         )
 
         try:
-            # Create async wrapper for Anthropic API call
-            async def anthropic_call():
-                return self.anthropic.messages.create(
-                    model=self.config.get("model"),
-                    max_tokens=1000,
-                    temperature=self.config.get("temperature", 0),
-                    messages=[{"role": "user", "content": prompt}],
-                )
-
-            response = await self.rate_limiter.call_anthropic_api(anthropic_call)
-
-            return response.content[0].text
+            content = await self._create_message(prompt, 1000)
+            self._cache_section(section, topic, section_type, content, context_text)
+            return content
 
         except Exception as e:
             self.logger.error(
@@ -589,33 +817,73 @@ class ImprovedReportGenerator:
             )
             return f"## {section.title}\n\nThis section could not be generated due to an error."
 
+    def _section_cache_key(
+        self, section: Section, topic: str, section_type: str, context: str
+    ) -> Tuple[str, str]:
+        """Exact-match key and similarity text for the response cache"""
+        key = SemanticCache.make_key(
+            self.config.get_prompt_template(), section_type, section.title
+        )
+        return key, f"{topic}\n{section.title}\n{section.description}\n{context}"
+
+    def _get_cached_section(
+        self, section: Section, topic: str, section_type: str, context: str = ""
+    ) -> Optional[str]:
+        """Look up a previously written version of this section"""
+        if not self.semantic_cache:
+            return None
+
+        content = self.semantic_cache.get(
+            *self._section_cache_key(section, topic, section_type, context)
+        )
+        if content:
+            self.logger.info(
+                "Response cache hit for section",
+                section_title=section.title,
+                section_type=section_type,
+            )
+        return content
+
+    def _cache_section(
+        self,
+        section: Section,
+        topic: str,
+        section_type: str,
+        content: str,
+        context: str = "",
+    ) -> None:
+        """Remember a written section for similar future requests"""
+        if self.semantic_cache:
+            self.semantic_cache.put(
+                *self._section_cache_key(section, topic, section_type, context),
+                content,
+            )
+
     def _compile_report(self, plan: ReportPlan) -> str:
         """Compile all sections into final markdown report"""
 
-        report = f"# {plan.title}\n\n"
+        parts = [f"# {plan.title}\n\n"]
 
         for section in plan.sections:
             content = section.content
-            if content.startswith(f"## {section.title}"):
-                report += f"{content}\n\n"
-            else:
-                report += f"## {section.title}\n\n{content}\n\n"
+            if not content.startswith(f"## {section.title}"):
+                parts.append(f"## {section.title}\n\n")
+            parts.append(content)
+            parts.append("\n\n")
 
         # Add metadata
-        from datetime import datetime
-
         timestamp_format = self.config.get("timestamp_format", "%Y-%m-%d %H:%M:%S")
         template = self.config.get_prompt_template()
 
-        report += f"\n---\n*{template.title()} report generated on {datetime.now().strftime(timestamp_format)}*"
+        parts.append(
+            f"\n---\n*{template.title()} report generated on {datetime.now().strftime(timestamp_format)}*"
+        )
 
-        return report
+        return "".join(parts)
 
     def save_report(self, report_content: str, filename: str = None) -> str:
         """Save report to configured output directory"""
         if not filename:
-            from datetime import datetime
-
             timestamp_format = self.config.get("timestamp_format", "%Y%m%d_%H%M%S")
             timestamp = datetime.now().strftime(timestamp_format)
             template = self.config.get_prompt_template()
@@ -629,76 +897,83 @@ class ImprovedReportGenerator:
 
         return filepath
 
+    async def asave_report(self, report_content: str, filename: str = None) -> str:
+        """Save report without blocking the event loop on disk writes"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.save_report, report_content, filename
+        )
+
 
 # Factory functions for different report types
-async def generate_business_report(topic: str) -> str:
+async def _generate_preset_report(
+    preset_name: str,
+    topic: str,
+    anthropic_client: AsyncAnthropic = None,
+    tavily_client: AsyncTavilyClient = None,
+) -> str:
+    """Generate a report with a configuration preset"""
+    async with ImprovedReportGenerator(
+        get_config(preset_name), anthropic_client, tavily_client
+    ) as generator:
+        return await generator.generate_report(topic)
+
+
+async def generate_business_report(topic: str, **clients: Any) -> str:
     """Generate a business-focused report"""
-    from config import BUSINESS_CONFIG
-
-    generator = ImprovedReportGenerator(BUSINESS_CONFIG)
-    return await generator.generate_report(topic)
+    return await _generate_preset_report("business", topic, **clients)
 
 
-async def generate_academic_report(topic: str) -> str:
+async def generate_academic_report(topic: str, **clients: Any) -> str:
     """Generate an academic-style report"""
-    from config import ACADEMIC_CONFIG
+    return await _generate_preset_report("academic", topic, **clients)
 
-    generator = ImprovedReportGenerator(ACADEMIC_CONFIG)
-    return await generator.generate_report(topic)
 
-
-async def generate_technical_report(topic: str) -> str:
+async def generate_technical_report(topic: str, **clients: Any) -> str:
     """Generate a technical report"""
-    from config import TECHNICAL_CONFIG
-
-    generator = ImprovedReportGenerator(TECHNICAL_CONFIG)
-    return await generator.generate_report(topic)
+    return await _generate_preset_report("technical", topic, **clients)
 
 
-async def generate_quick_report(topic: str) -> str:
+async def generate_quick_report(topic: str, **clients: Any) -> str:
     """Generate a quick, shorter report"""
-    from config import QUICK_CONFIG
-
-    generator = ImprovedReportGenerator(QUICK_CONFIG)
-    return await generator.generate_report(topic)
+    return await _generate_preset_report("quick", topic, **clients)
 
 
 # Example usage with different templates
 async def demo_different_templates():
     """Demonstrate different report templates"""
-    from utils.observability import ComponentType, get_logger
-
     logger = get_logger(ComponentType.REPORT_GENERATOR)
     topic = "Artificial Intelligence in Healthcare"
+    templates = ["business", "academic", "technical", "quick"]
 
     logger.info("Starting template demonstration", topic=topic)
 
-    logger.info("Generating business report", template="business")
-    business_report = await generate_business_report(topic)
-
-    logger.info("Generating academic report", template="academic")
-    academic_report = await generate_academic_report(topic)
-
-    logger.info("Generating technical report", template="technical")
-    technical_report = await generate_technical_report(topic)
-
-    logger.info("Generating quick report", template="quick")
-    quick_report = await generate_quick_report(topic)
+    # One pair of clients serves all four reports, so connections are reused
+    anthropic_client = create_anthropic_client(get_config("standard"))
+    tavily_client = create_tavily_client()
+    try:
+        logger.info("Generating reports concurrently", templates=templates)
+        reports = await asyncio.gather(
+            *(
+                _generate_preset_report(
+                    template, topic, anthropic_client, tavily_client
+                )
+                for template in templates
+            )
+        )
+    finally:
+        await anthropic_client.close()
+        await close_tavily_client(tavily_client)
 
     logger.info(
         "All template reports generated successfully",
         topic=topic,
-        templates_generated=["business", "academic", "technical", "quick"],
+        templates_generated=templates,
     )
 
-    return {
-        "business": business_report,
-        "academic": academic_report,
-        "technical": technical_report,
-        "quick": quick_report,
-    }
+    return dict(zip(templates, reports))
 
 
 if __name__ == "__main__":
     # Demo the improved generator
-    asyncio.run(demo_different_templates())
+    run(demo_different_templates())
@@ -5,7 +5,8 @@ Pytest configuration and shared fixtures for the test suite
 import asyncio
 import os
 import sys
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -13,39 +14,13 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    import asyncio
-
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(autouse=True)
-def setup_async_environment():
-    """Ensure we have a clean async environment for each test."""
-    import asyncio
-
+def reset_global_state():
+    """Reset the shared rate limiter so tests don't affect each other"""
     import utils.rate_limiter
 
-    # Reset any global state
     utils.rate_limiter.reset_rate_limiter()
 
-    # Ensure we have a fresh event loop policy
-    asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
-
-    yield
-
-    # Clean up after test
-    try:
-        loop = asyncio.get_event_loop()
-        if not loop.is_closed():
-            loop.close()
-    except:
-        pass
-
 
 @pytest.fixture
 def mock_anthropic_client():
@@ -71,51 +46,58 @@ def mock_tavily_client():
     return mock_client
 
 
-@pytest.fixture
+# Read-only fixture data below is built once and shared by every test;
+# tests must copy it before changing anything
+
+_SAMPLE_REPORT_PLAN = {
+    "title": "Test Report: AI in Healthcare",
+    "sections": [
+        {
+            "title": "Introduction",
+            "description": "Overview of AI in healthcare",
+            "needs_research": False,
+        },
+        {
+            "title": "Current Applications",
+            "description": "Existing AI applications in healthcare",
+            "needs_research": True,
+        },
+        {
+            "title": "Future Prospects",
+            "description": "Future developments and potential",
+            "needs_research": True,
+        },
+        {
+            "title": "Conclusion",
+            "description": "Summary and key insights",
+            "needs_research": False,
+        },
+    ],
+}
+
+
+@pytest.fixture(scope="session")
 def sample_report_plan():
-    """Sample report plan for testing"""
-    return {
-        "title": "Test Report: AI in Healthcare",
-        "sections": [
-            {
-                "title": "Introduction",
-                "description": "Overview of AI in healthcare",
-                "needs_research": False,
-            },
-            {
-                "title": "Current Applications",
-                "description": "Existing AI applications in healthcare",
-                "needs_research": True,
-            },
-            {
-                "title": "Future Prospects",
-                "description": "Future developments and potential",
-                "needs_research": True,
-            },
-            {
-                "title": "Conclusion",
-                "description": "Summary and key insights",
-                "needs_research": False,
-            },
-        ],
-    }
+    """Sample report plan for testing (shared; do not mutate)"""
+    return _SAMPLE_REPORT_PLAN
 
 
-@pytest.fixture
+_SAMPLE_SEARCH_QUERIES = (
+    "AI healthcare applications 2024",
+    "machine learning medical diagnosis",
+    "artificial intelligence patient care systems",
+    "AI medical imaging analysis",
+)
+
+
+@pytest.fixture(scope="session")
 def sample_search_queries():
-    """Sample search queries for testing"""
-    return [
-        "AI healthcare applications 2024",
-        "machine learning medical diagnosis",
-        "artificial intelligence patient care systems",
-        "AI medical imaging analysis",
-    ]
+    """Sample search queries for testing (shared; do not mutate)"""
+    return _SAMPLE_SEARCH_QUERIES
 
 
-@pytest.fixture
-def mock_config():
-    """Mock configuration for testing"""
-    return {
+_MOCK_CONFIG = MappingProxyType(
+    {
         "template": "business",
         "model": "claude-3-5-sonnet-20240620",
         "max_tokens": 2000,
@@ -129,6 +111,13 @@ def mock_config():
         "enable_search_caching": False,  # Disable for testing
         "enable_prompt_versioning": False,  # Disable for testing
     }
+)
+
+
+@pytest.fixture(scope="session")
+def mock_config():
+    """Mock configuration for testing (shared; do not mutate)"""
+    return _MOCK_CONFIG
 
 
 @pytest.fixture
@@ -147,26 +136,47 @@ def temp_prompt_versions_dir(tmp_path):
     return str(versions_dir)
 
 
+# Canned reply for every mocked Claude request, built once at import
+_MOCK_RESPONSE = MagicMock()
+_MOCK_RESPONSE.content = [MagicMock(text='{"title": "Mock Report", "sections": []}')]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _patch_network(request):
+    """Patch the API client classes once for the whole test session"""
+    mocks = {}
+    for name, target in (
+        ("anthropic", "anthropic.AsyncAnthropic"),
+        ("tavily", "tavily.AsyncTavilyClient"),
+    ):
+        patcher = patch(target)
+        client_class = patcher.start()
+        request.addfinalizer(patcher.stop)
+        client_class.return_value = mocks[name] = MagicMock()
+
+    # Request mocks are reattached each test in case a test replaced them
+    mocks["anthropic_create"] = AsyncMock(return_value=_MOCK_RESPONSE)
+    mocks["tavily_search"] = AsyncMock(return_value=[])
+    return mocks
+
+
 @pytest.fixture(autouse=True)
-def no_network_calls():
+def no_network_calls(_patch_network):
     """Prevent actual network calls during testing"""
-    with patch("anthropic.Anthropic") as mock_anthropic, patch(
-        "tavily.TavilyClient"
-    ) as mock_tavily:
-        # Configure mock responses
-        mock_anthropic_instance = MagicMock()
-        mock_response = MagicMock()
-        mock_response.content = [
-            MagicMock(text='{"title": "Mock Report", "sections": []}')
-        ]
-        mock_anthropic_instance.messages.create.return_value = mock_response
-        mock_anthropic.return_value = mock_anthropic_instance
+    mock_anthropic_instance = _patch_network["anthropic"]
+    mock_tavily_instance = _patch_network["tavily"]
+    create = _patch_network["anthropic_create"]
+    search = _patch_network["tavily_search"]
 
-        mock_tavily_instance = MagicMock()
-        mock_tavily_instance.search.return_value = []
-        mock_tavily.return_value = mock_tavily_instance
+    # Clear calls and overrides left behind by the previous test
+    for mock in (mock_anthropic_instance, mock_tavily_instance, create, search):
+        mock.reset_mock(return_value=True, side_effect=True)
+    create.return_value = _MOCK_RESPONSE
+    search.return_value = []
+    mock_anthropic_instance.messages.create = create
+    mock_tavily_instance.search = search
 
-        yield {"anthropic": mock_anthropic_instance, "tavily": mock_tavily_instance}
+    yield {"anthropic": mock_anthropic_instance, "tavily": mock_tavily_instance}
 
 
 # Test markers for different types of tests
@@ -189,52 +199,50 @@ def pytest_collection_modifyitems(config, items):
 
 
 # Fixtures for specific test scenarios
-@pytest.fixture
+_MALFORMED_JSON_SAMPLES = (
+    '{"title": "Test", "sections":}',  # Missing value
+    '{"title": "Test" "sections": []}',  # Missing comma
+    '{title: "Test", "sections": []}',  # Unquoted key
+    '{"title": "Test", "sections": [}',  # Missing bracket
+    '{"title": "Test", "sections": []',  # Missing closing brace
+    "This is not JSON at all",  # Not JSON
+    "",  # Empty string
+    "   ",  # Whitespace only
+    '{"title": "Test", // comment\n"sections": []}',  # Comments
+    '{"title": "Test",,, "sections": []}',  # Extra commas
+)
+
+
+@pytest.fixture(scope="session")
 def malformed_json_samples():
-    """Collection of malformed JSON samples for testing robustness"""
-    return [
-        '{"title": "Test", "sections":}',  # Missing value
-        '{"title": "Test" "sections": []}',  # Missing comma
-        '{title: "Test", "sections": []}',  # Unquoted key
-        '{"title": "Test", "sections": [}',  # Missing bracket
-        '{"title": "Test", "sections": []',  # Missing closing brace
-        "This is not JSON at all",  # Not JSON
-        "",  # Empty string
-        "   ",  # Whitespace only
-        '{"title": "Test", // comment\n"sections": []}',  # Comments
-        '{"title": "Test",,, "sections": []}',  # Extra commas
-    ]
+    """Malformed JSON samples for testing robustness (shared; do not mutate)"""
+    return _MALFORMED_JSON_SAMPLES
 
 
-@pytest.fixture
-def valid_json_variations():
-    """Collection of valid JSON in different formats"""
-    base_json = {"title": "Test Report", "sections": []}
-
-    return [
-        # Clean JSON
-        '{"title": "Test Report", "sections": []}',
-        # Markdown wrapped
-        """```json
+_VALID_JSON_VARIATIONS = (
+    # Clean JSON
+    '{"title": "Test Report", "sections": []}',
+    # Markdown wrapped
+    """```json
         {"title": "Test Report", "sections": []}
         ```""",
-        # With explanation text
-        """Here's the structure:
+    # With explanation text
+    """Here's the structure:
 
         ```json
         {"title": "Test Report", "sections": []}
         ```
 
         This should work well.""",
-        # Multiline formatted
-        """
+    # Multiline formatted
+    """
         {
             "title": "Test Report",
             "sections": []
         }
         """,
-        # With extra fields
-        """
+    # With extra fields
+    """
         {
             "title": "Test Report",
             "sections": [],
@@ -242,33 +250,52 @@ def valid_json_variations():
             "timestamp": "2024-01-01"
         }
         """,
-    ]
+)
 
 
-@pytest.fixture
-def rate_limit_scenarios():
-    """Common rate limiting test scenarios"""
-    return {
-        "no_limits": {
-            "anthropic_rate_limit_delay": 0.0,
-            "tavily_rate_limit_delay": 0.0,
-            "enable_rate_limiting": False,
-        },
-        "strict_limits": {
-            "anthropic_rate_limit_delay": 0.1,
-            "tavily_rate_limit_delay": 0.1,
-            "enable_rate_limiting": True,
-        },
-        "anthropic_only": {
-            "anthropic_rate_limit_delay": 0.1,
-            "tavily_rate_limit_delay": 0.0,
-            "enable_rate_limiting": True,
-        },
-        "production_like": {
-            "anthropic_rate_limit_delay": 1.0,
-            "tavily_rate_limit_delay": 0.5,
-            "enable_rate_limiting": True,
-            "max_retries": 3,
-            "retry_base_delay": 1.0,
-        },
+@pytest.fixture(scope="session")
+def valid_json_variations():
+    """Valid JSON in different formats (shared; do not mutate)"""
+    return _VALID_JSON_VARIATIONS
+
+
+_RATE_LIMIT_SCENARIOS = MappingProxyType(
+    {
+        "no_limits": MappingProxyType(
+            {
+                "anthropic_rate_limit_delay": 0.0,
+                "tavily_rate_limit_delay": 0.0,
+                "enable_rate_limiting": False,
+            }
+        ),
+        "strict_limits": MappingProxyType(
+            {
+                "anthropic_rate_limit_delay": 0.1,
+                "tavily_rate_limit_delay": 0.1,
+                "enable_rate_limiting": True,
+            }
+        ),
+        "anthropic_only": MappingProxyType(
+            {
+                "anthropic_rate_limit_delay": 0.1,
+                "tavily_rate_limit_delay": 0.0,
+                "enable_rate_limiting": True,
+            }
+        ),
+        "production_like": MappingProxyType(
+            {
+                "anthropic_rate_limit_delay": 1.0,
+                "tavily_rate_limit_delay": 0.5,
+                "enable_rate_limiting": True,
+                "max_retries": 3,
+                "retry_base_delay": 1.0,
+            }
+        ),
     }
+)
+
+
+@pytest.fixture(scope="session")
+def rate_limit_scenarios():
+    """Common rate limiting test scenarios (shared; do not mutate)"""
+    return _RATE_LIMIT_SCENARIOS
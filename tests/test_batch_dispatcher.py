@@ -0,0 +1,100 @@
+"""
+Unit tests for the Message Batches dispatcher
+Covers request coalescing, polling and per-request failures
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from utils.batch_dispatcher import BatchDispatcher, BatchRequestError
+
+
+class FakeBatches:
+    """Minimal stand-in for client.messages.batches"""
+
+    def __init__(self, polls_until_ended=1, fail_ids=(), create_error=None):
+        self.polls_until_ended = polls_until_ended
+        self.fail_ids = set(fail_ids)
+        self.create_error = create_error
+        self.submitted = []
+        self.retrieve_calls = 0
+
+    async def create(self, requests):
+        if self.create_error:
+            raise self.create_error
+        self.submitted.append(requests)
+        return SimpleNamespace(id="batch-1", processing_status="in_progress")
+
+    async def retrieve(self, batch_id):
+        self.retrieve_calls += 1
+        ended = self.retrieve_calls >= self.polls_until_ended
+        return SimpleNamespace(
+            id=batch_id, processing_status="ended" if ended else "in_progress"
+        )
+
+    async def results(self, batch_id):
+        async def entries():
+            for request in self.submitted[-1]:
+                custom_id = request["custom_id"]
+                if custom_id in self.fail_ids:
+                    result = SimpleNamespace(type="errored")
+                else:
+                    prompt = request["params"]["messages"][0]["content"]
+                    block = SimpleNamespace(type="text", text=f"reply to {prompt}")
+                    message = SimpleNamespace(content=[block])
+                    result = SimpleNamespace(type="succeeded", message=message)
+                yield SimpleNamespace(custom_id=custom_id, result=result)
+
+        return entries()
+
+
+def make_dispatcher(batches):
+    client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+    return BatchDispatcher(client, window_seconds=0, poll_interval=0)
+
+
+def ask(dispatcher, prompt):
+    return dispatcher.create_message(
+        model="m", max_tokens=10, messages=[{"role": "user", "content": prompt}]
+    )
+
+
+class TestBatchDispatcher:
+    """Test batching of concurrent requests"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self):
+        """Test requests made in the same window are submitted together"""
+        batches = FakeBatches(polls_until_ended=3)
+        dispatcher = make_dispatcher(batches)
+
+        replies = await asyncio.gather(ask(dispatcher, "a"), ask(dispatcher, "b"))
+
+        assert replies == ["reply to a", "reply to b"]
+        assert len(batches.submitted) == 1
+        assert batches.retrieve_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_request_raises(self):
+        """Test a request that did not succeed raises while others resolve"""
+        dispatcher = make_dispatcher(FakeBatches(fail_ids={"request-2"}))
+
+        replies = await asyncio.gather(
+            ask(dispatcher, "a"), ask(dispatcher, "b"), return_exceptions=True
+        )
+
+        assert replies[0] == "reply to a"
+        assert isinstance(replies[1], BatchRequestError)
+
+    @pytest.mark.asyncio
+    async def test_submission_error_reaches_every_caller(self):
+        """Test a failed batch submission is raised to all waiting requests"""
+        dispatcher = make_dispatcher(FakeBatches(create_error=RuntimeError("down")))
+
+        replies = await asyncio.gather(
+            ask(dispatcher, "a"), ask(dispatcher, "b"), return_exceptions=True
+        )
+
+        assert all(isinstance(reply, RuntimeError) for reply in replies)
@@ -0,0 +1,110 @@
+"""
+Unit tests for report configuration
+Covers setting lookups, overrides and cache invalidation
+"""
+
+from config import ReportConfig, clear_config_cache, get_config
+
+
+class TestReportConfig:
+    """Test configuration lookups and updates"""
+
+    def test_defaults_and_overrides(self):
+        """Test custom settings override defaults"""
+        config = ReportConfig({"template": "business", "max_tokens": 1234})
+
+        assert config.get("template") == "business"
+        assert config.get("max_tokens") == 1234
+        assert config.get("search_depth") == "advanced"
+
+    def test_get_missing_key_returns_default(self):
+        """Test missing keys fall back to the provided default"""
+        config = ReportConfig()
+
+        assert config.get("does_not_exist") is None
+        assert config.get("does_not_exist", "fallback") == "fallback"
+
+    def test_set_invalidates_cached_value(self):
+        """Test set() is visible to subsequent get() calls"""
+        config = ReportConfig()
+
+        assert config.get("template") == "standard"
+        config.set("template", "academic")
+
+        assert config.get("template") == "academic"
+        assert config.get_prompt_template() == "academic"
+
+    def test_word_count_for_section_type(self):
+        """Test word counts resolve per section type"""
+        config = ReportConfig({"intro_word_count": "10-20"})
+
+        assert config.get_word_count_for_section_type("introduction") == "10-20"
+        assert config.get_word_count_for_section_type("unknown") == "300-500"
+
+        config.set("section_word_count", "50-60")
+        assert config.get_word_count_for_section_type("unknown") == "50-60"
+
+    def test_set_does_not_mutate_shared_defaults(self):
+        """Test overrides never leak into the shared default settings"""
+        first = ReportConfig()
+        second = ReportConfig()
+
+        first.set("max_tokens", 42)
+
+        assert first.get("max_tokens") == 42
+        assert second.get("max_tokens") == 2000
+        assert ReportConfig.DEFAULT_SETTINGS["max_tokens"] == 2000
+
+    def test_default_config_allocates_overrides_on_first_set(self):
+        """Test default configs share DEFAULT_SETTINGS until first set()"""
+        config = ReportConfig()
+        settings = config.settings
+
+        assert settings.maps == [ReportConfig.DEFAULT_SETTINGS]
+
+        config.set("template", "technical")
+
+        assert config.settings is settings
+        assert settings["template"] == "technical"
+        assert len(settings.maps) == 2
+
+
+class TestConfigPresets:
+    """Test preset lookup"""
+
+    def test_presets_are_shared_instances(self):
+        """Test each preset is built once and reused"""
+        assert get_config("business") is get_config("business")
+        assert get_config("business").get_prompt_template() == "business"
+        assert get_config().get_prompt_template() == "standard"
+
+    def test_unknown_preset_returns_fresh_default(self):
+        """Test unknown preset names get an unshared default config"""
+        config = get_config("no-such-preset")
+
+        assert config.get_prompt_template() == "standard"
+        assert config is not get_config("no-such-preset")
+        assert config is not get_config("standard")
+
+    def test_legacy_preset_names(self):
+        """Test module-level preset aliases still resolve"""
+        from config import ACADEMIC_CONFIG, CONFIG_PRESETS
+
+        assert ACADEMIC_CONFIG is get_config("academic")
+        assert set(CONFIG_PRESETS) == {
+            "business",
+            "academic",
+            "technical",
+            "quick",
+            "standard",
+        }
+
+    def test_clear_config_cache(self):
+        """Test clearing the cache discards mutated presets"""
+        config = get_config("quick")
+        config.set("max_tokens", 1)
+
+        clear_config_cache()
+
+        assert get_config("quick") is not config
+        assert get_config("quick").get("max_tokens") == 2000
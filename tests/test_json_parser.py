@@ -7,7 +7,105 @@ import json
 
 import pytest
 
-from utils.json_parser import RobustJSONParser, parse_report_plan, parse_search_queries
+from utils.json_parser import (
+    RobustJSONParser,
+    parse_bulk_search_queries,
+    parse_report_plan,
+    parse_search_queries,
+)
+
+MALFORMED_JSON_TEXTS = [
+    pytest.param('{"title": "Test", "sections":}', id="missing_value"),
+    pytest.param('{"title": "Test" "sections": []}', id="missing_comma"),
+    pytest.param('{title: "Test", "sections": []}', id="unquoted_key"),
+    pytest.param('{"title": "Test", "sections": [}', id="missing_bracket"),
+    pytest.param("This is not JSON at all", id="not_json"),
+    pytest.param("", id="empty_string"),
+    pytest.param("   ", id="whitespace_only"),
+]
+
+INVALID_REPORT_PLANS = [
+    pytest.param('{"title": "Test"}', id="missing_sections"),
+    pytest.param('{"sections": []}', id="missing_title"),
+    pytest.param(
+        '{"title": "Test", "sections": "invalid"}', id="invalid_sections_type"
+    ),
+]
+
+REPORT_PLAN_LLM_RESPONSES = [
+    pytest.param(
+        """
+        I'll create a report structure for you:
+
+        ```json
+        {"title": "Test Report", "sections": []}
+        ```
+
+        This structure should work well for your needs.
+        """,
+        id="explanation_text",
+    ),
+    pytest.param(
+        """
+        ## Report Structure
+
+        ```json
+        {"title": "Test Report", "sections": []}
+        ```
+        """,
+        id="markdown_formatting",
+    ),
+    pytest.param('{"title": "Test Report", "sections": []}', id="direct_json"),
+    pytest.param(
+        """
+        {
+            // This is the report title
+            "title": "Test Report",
+            "sections": []
+        }
+        """,
+        id="json_with_comments",
+    ),
+]
+
+SEARCH_QUERY_FORMATS = [
+    pytest.param('["query 1", "query 2", "query 3"]', id="standard_array"),
+    pytest.param(
+        """
+        ```json
+        ["query 1", "query 2"]
+        ```
+        """,
+        id="markdown",
+    ),
+    pytest.param(
+        """
+        [
+            "query 1",
+            "query 2",
+            "query 3"
+        ]
+        """,
+        id="multiline_array",
+    ),
+]
+
+INVALID_SEARCH_QUERIES = [
+    pytest.param('"single string query"', id="string_not_array"),
+    pytest.param("[]", id="empty_array"),
+    pytest.param("[123, 456]", id="numbers_not_strings"),
+    pytest.param(
+        '{"other_field": ["query 1", "query 2"]}', id="object_without_query_key"
+    ),
+]
+
+SEARCH_QUERY_EDGE_CASES = [
+    pytest.param('["' + "x" * 500 + '", "normal query"]', 2, id="very_long_query"),
+    pytest.param(
+        '["query with émojis 🔍", "quotes \\"test\\""]', 2, id="special_characters"
+    ),
+    pytest.param('["valid query", "", "another valid"]', 3, id="empty_string_item"),
+]
 
 
 class TestRobustJSONParser:
@@ -83,21 +181,10 @@ class TestRobustJSONParser:
         assert result is not None
         assert result["title"] == "Business Analysis"
 
-    def test_malformed_json_returns_none(self):
+    @pytest.mark.parametrize("text", MALFORMED_JSON_TEXTS)
+    def test_malformed_json_returns_none(self, text):
         """Test that malformed JSON returns None instead of crashing"""
-        malformed_texts = [
-            '{"title": "Test", "sections":}',  # Missing value
-            '{"title": "Test" "sections": []}',  # Missing comma
-            '{title: "Test", "sections": []}',  # Unquoted key
-            '{"title": "Test", "sections": [}',  # Missing bracket
-            "This is not JSON at all",
-            "",  # Empty string
-            "   ",  # Whitespace only
-        ]
-
-        for text in malformed_texts:
-            result = RobustJSONParser.extract_json_from_text(text, "object")
-            assert result is None, f"Should return None for: {text}"
+        assert RobustJSONParser.extract_json_from_text(text, "object") is None
 
     def test_json_with_special_characters(self):
         """Test JSON with special characters and unicode"""
@@ -213,17 +300,10 @@ class TestReportPlanParsing:
         assert result["sections"][0]["needs_research"] is False
         assert result["sections"][1]["needs_research"] is True
 
-    def test_report_plan_missing_required_fields(self):
+    @pytest.mark.parametrize("plan", INVALID_REPORT_PLANS)
+    def test_report_plan_missing_required_fields(self, plan):
         """Test report plan with missing required fields"""
-        invalid_plans = [
-            '{"title": "Test"}',  # Missing sections
-            '{"sections": []}',  # Missing title
-            '{"title": "Test", "sections": "invalid"}',  # Invalid sections type
-        ]
-
-        for plan in invalid_plans:
-            result = parse_report_plan(plan)
-            assert result is None, f"Should reject plan: {plan}"
+        assert parse_report_plan(plan) is None
 
     def test_report_plan_with_extra_fields(self):
         """Test report plan with extra fields (should still work)"""
@@ -242,46 +322,13 @@ class TestReportPlanParsing:
         assert result["title"] == "Test Report"
         assert "author" in result  # Extra fields preserved
 
-    def test_report_plan_llm_response_variations(self):
+    @pytest.mark.parametrize("variation", REPORT_PLAN_LLM_RESPONSES)
+    def test_report_plan_llm_response_variations(self, variation):
         """Test various ways LLM might format the response"""
-        variations = [
-            # With explanation text
-            """
-            I'll create a report structure for you:
-
-            ```json
-            {"title": "Test Report", "sections": []}
-            ```
-
-            This structure should work well for your needs.
-            """,
-            # With markdown formatting
-            """
-            ## Report Structure
-
-            ```json
-            {"title": "Test Report", "sections": []}
-            ```
-            """,
-            # Direct JSON response
-            '{"title": "Test Report", "sections": []}',
-            # JSON with comments (should handle gracefully)
-            """
-            {
-                // This is the report title
-                "title": "Test Report",
-                "sections": []
-            }
-            """,
-        ]
+        result = parse_report_plan(variation)
 
-        for i, variation in enumerate(variations):
-            result = parse_report_plan(variation)
-            # All variations should now work with improved parser
-            assert (
-                result is not None
-            ), f"Failed to parse variation {i}: {variation[:50]}..."
-            assert result["title"] == "Test Report"
+        assert result is not None
+        assert result["title"] == "Test Report"
 
 
 class TestSearchQueriesParsing:
@@ -301,67 +348,59 @@ class TestSearchQueriesParsing:
         assert len(result) == 3
         assert "2024" in result[0]
 
-    def test_search_queries_different_formats(self):
+    @pytest.mark.parametrize("format_text", SEARCH_QUERY_FORMATS)
+    def test_search_queries_different_formats(self, format_text):
         """Test various formats LLM might use for queries"""
-        formats = [
-            # Standard array
-            '["query 1", "query 2", "query 3"]',
-            # With markdown
-            """
-            ```json
-            ["query 1", "query 2"]
-            ```
-            """,
-            # Multiline array
-            """
-            [
-                "query 1",
-                "query 2",
-                "query 3"
-            ]
-            """,
-        ]
+        result = parse_search_queries(format_text)
 
-        for format_text in formats:
-            result = parse_search_queries(format_text)
-            assert result is not None, f"Failed to parse: {format_text}"
-            assert isinstance(result, list)
-            assert len(result) >= 2
+        assert isinstance(result, list)
+        assert len(result) >= 2
 
-    def test_search_queries_invalid_formats(self):
+    @pytest.mark.parametrize("invalid", INVALID_SEARCH_QUERIES)
+    def test_search_queries_invalid_formats(self, invalid):
         """Test handling of invalid query formats"""
-        invalid_formats = [
-            '"single string query"',  # String instead of array
-            "[]",  # Empty array
-            "[123, 456]",  # Numbers instead of strings
-            '{"other_field": ["query 1", "query 2"]}',  # Object without recognized query key
-        ]
+        assert parse_search_queries(invalid) is None
 
-        for invalid in invalid_formats:
-            result = parse_search_queries(invalid)
-            assert result is None, f"Should reject: {invalid}"
+    def test_search_queries_nested_query_key(self):
+        """Test that nested objects with query arrays ARE accepted"""
+        result = parse_search_queries('{"queries": ["query 1", "query 2"]}')
 
-        # Test that nested objects with query arrays ARE accepted
-        valid_nested = '{"queries": ["query 1", "query 2"]}'
-        result = parse_search_queries(valid_nested)
-        assert result is not None, "Should accept nested object with queries key"
         assert result == ["query 1", "query 2"]
 
-    def test_search_queries_edge_cases(self):
+    @pytest.mark.parametrize("text,expected_len", SEARCH_QUERY_EDGE_CASES)
+    def test_search_queries_edge_cases(self, text, expected_len):
         """Test edge cases in search query parsing"""
-        edge_cases = [
-            # Very long queries
-            ['["' + "x" * 500 + '", "normal query"]', 2],
-            # Special characters
-            ['["query with émojis 🔍", "quotes \\"test\\""]', 2],
-            # Empty strings in array
-            ['["valid query", "", "another valid"]', 3],
-        ]
+        result = parse_search_queries(text)
 
-        for text, expected_len in edge_cases:
-            result = parse_search_queries(text)
-            assert result is not None
-            assert len(result) == expected_len
+        assert result is not None
+        assert len(result) == expected_len
+
+
+class TestBulkSearchQueriesParsing:
+    """Test per-section search queries JSON parsing"""
+
+    def test_valid_bulk_queries(self):
+        """Test parsing a section title -> queries object"""
+        text = """```json
+        {"Market Overview": ["AI market size 2024"], "Key Players": ["AI leaders"]}
+        ```"""
+        result = parse_bulk_search_queries(text)
+
+        assert result == {
+            "Market Overview": ["AI market size 2024"],
+            "Key Players": ["AI leaders"],
+        }
+
+    def test_malformed_entries_are_dropped(self):
+        """Test entries that are not non-empty string arrays are skipped"""
+        text = '{"A": ["q1"], "B": [], "C": "q", "D": [1, 2]}'
+
+        assert parse_bulk_search_queries(text) == {"A": ["q1"]}
+
+    def test_non_object_returns_none(self):
+        """Test arrays and unusable objects are rejected"""
+        assert parse_bulk_search_queries('["q1", "q2"]') is None
+        assert parse_bulk_search_queries('{"A": []}') is None
 
 
 class TestErrorHandling:
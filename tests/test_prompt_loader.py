@@ -0,0 +1,79 @@
+"""
+Unit tests for prompt loading utilities
+Covers compiled prompt templates against str.format and split writing prompts
+"""
+
+import pytest
+
+from config import create_custom_config
+import prompts.planning
+import prompts.writing
+from prompts._compiled import compile_prompt_template
+from utils.prompt_loader import PromptLoader
+
+FIELDS = {
+    "topic": "AI at 100% {scale}",
+    "section_title": "Background",
+    "section_description": "History of the field",
+    "sources": "Source 1",
+    "word_count": "300-500",
+    "context_sections": "Earlier sections",
+    "sections": "- Background: History",
+}
+
+
+class TestCompilePromptTemplate:
+    """Test compiled templates render exactly like str.format"""
+
+    @pytest.mark.parametrize("module", [prompts.planning, prompts.writing])
+    def test_matches_format_for_static_prompts(self, module):
+        """Test every static prompt renders identically"""
+        for prompt in module.TEMPLATES.values():
+            assert compile_prompt_template(prompt)(**FIELDS) == prompt.format(**FIELDS)
+
+    def test_escaped_braces_and_percent(self):
+        """Test {{ }} escapes and literal percent signs survive"""
+        render = compile_prompt_template('{{"topic": "{topic}"}} 50%')
+
+        assert render(topic="x") == '{"topic": "x"} 50%'
+
+    def test_format_spec_falls_back_to_format(self):
+        """Test fields with format specs still render"""
+        assert compile_prompt_template("{count:>3}")(count=7) == "  7"
+
+    def test_missing_field_raises_key_error(self):
+        """Test missing fields fail like str.format"""
+        with pytest.raises(KeyError):
+            compile_prompt_template("{topic}")(other="x")
+
+
+class TestPromptModules:
+    """Test the prompt modules' name-based rendering"""
+
+    @pytest.mark.parametrize("module", [prompts.planning, prompts.writing])
+    def test_render_matches_format(self, module):
+        """Test render() by name matches formatting the constant"""
+        for name, template in module.TEMPLATES.items():
+            assert module.render(name, **FIELDS) == template.format(**FIELDS)
+            assert getattr(module, name) is template
+
+
+class TestSectionWritingPromptParts:
+    """Test writing prompts split around their sources"""
+
+    @pytest.mark.parametrize("template", ["standard", "academic", "technical"])
+    @pytest.mark.parametrize(
+        "section_type", ["default", "literature_review", "technical_overview"]
+    )
+    def test_parts_join_to_full_prompt(self, template, section_type):
+        """Test inserting sources between the parts matches a full render"""
+        loader = PromptLoader(
+            create_custom_config(template=template, enable_prompt_versioning=False)
+        )
+        args = ("Background", "History of the field", "AI at 100% {scale}")
+
+        before, after = loader.get_section_writing_prompt_parts(*args, section_type)
+
+        assert before + "Source 1" + after == loader.get_section_writing_prompt(
+            *args, "Source 1", section_type
+        )
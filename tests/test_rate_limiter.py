@@ -9,11 +9,14 @@ import time
 import pytest
 
 from utils.rate_limiter import (
+    AIMDConcurrencyLimiter,
     APICallManager,
+    AsyncLeakyBucket,
     RateLimiter,
     RetryConfig,
     get_rate_limiter,
     reset_rate_limiter,  # Add this import
+    rate_limit_pause,
     retry_with_exponential_backoff,
 )
 
@@ -110,6 +113,147 @@ class TestRateLimiter:
         assert any(r >= 0.1 for r in results[1:])  # At least one delayed
 
 
+class TestAsyncLeakyBucket:
+    """Test leaky bucket permit scheduling"""
+
+    def test_concurrent_reservations_are_spaced(self):
+        """Test each caller gets its own slot one interval apart"""
+        bucket = AsyncLeakyBucket(interval=1.0)
+
+        waits = [bucket.reserve() for _ in range(3)]
+
+        assert waits[0] == 0.0
+        assert waits[1] == pytest.approx(1.0, abs=0.01)
+        assert waits[2] == pytest.approx(2.0, abs=0.01)
+
+    def test_burst_permits_are_immediate(self):
+        """Test up to burst permits are granted without waiting"""
+        bucket = AsyncLeakyBucket(interval=1.0, burst=3)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(1.0, abs=0.01)
+
+
+class TestAIMDConcurrency:
+    """Test adaptive concurrency limits"""
+
+    def test_throttling_halves_and_success_regrows(self):
+        """Test the limit halves on 429s and grows by half a slot per call"""
+        limiter = AIMDConcurrencyLimiter(max_concurrency=8)
+
+        limiter.record_throttled()
+        limiter.record_throttled()
+        assert limiter.limit == 2.0
+
+        limiter.record_latency(0.1)
+        assert limiter.limit == 2.5
+
+    def test_limit_stays_within_bounds(self):
+        """Test the limit never leaves [min_concurrency, max_concurrency]"""
+        limiter = AIMDConcurrencyLimiter(max_concurrency=2, min_concurrency=1)
+
+        for _ in range(5):
+            limiter.record_throttled()
+        assert limiter.limit == 1.0
+
+        for _ in range(5):
+            limiter.record_latency(0.1)
+        assert limiter.limit == 2.0
+
+    def test_slow_window_halves_limit(self):
+        """Test a full window averaging above the target shrinks the limit"""
+        limiter = AIMDConcurrencyLimiter(
+            max_concurrency=8, target_latency=1.0, window=4
+        )
+
+        for _ in range(4):
+            limiter.record_latency(2.0)
+
+        assert limiter.limit == 4.0
+
+    @pytest.mark.asyncio
+    async def test_waiters_run_when_slot_frees(self):
+        """Test calls beyond the limit wait for a running call to finish"""
+        limiter = AIMDConcurrencyLimiter(max_concurrency=1)
+        order = []
+
+        async def work(name):
+            async with limiter:
+                order.append(f"start {name}")
+                await asyncio.sleep(0.01)
+                order.append(f"end {name}")
+
+        await asyncio.gather(work("a"), work("b"))
+
+        assert order == ["start a", "end a", "start b", "end b"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_passes_slot_on(self):
+        """Test a waiter cancelled after being woken hands its slot to the next"""
+        limiter = AIMDConcurrencyLimiter(max_concurrency=1)
+        await limiter.acquire()
+
+        b = asyncio.ensure_future(limiter.acquire())
+        c = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        limiter.release()  # Wakes b
+        b.cancel()  # ...before b gets to run
+        await asyncio.wait_for(c, timeout=1.0)
+
+        assert b.cancelled()
+        assert limiter.active == 1
+
+
+class TestRateLimitHeaders:
+    """Test pausing on Anthropic rate limit headers"""
+
+    def test_retry_after(self):
+        """Test retry-after is honoured"""
+        assert rate_limit_pause({"retry-after": "7"}) == 7.0
+
+    def test_nearly_exhausted_limit_pauses_until_reset(self):
+        """Test running low on a limit pauses until its reset time"""
+        reset = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 30))
+        headers = {
+            "anthropic-ratelimit-tokens-limit": "10000",
+            "anthropic-ratelimit-tokens-remaining": "500",
+            "anthropic-ratelimit-tokens-reset": reset,
+        }
+
+        assert 25 < rate_limit_pause(headers) <= 30
+
+    def test_plenty_remaining_does_not_pause(self):
+        """Test no pause while every limit has headroom"""
+        headers = {
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "40",
+            "anthropic-ratelimit-requests-reset": "2099-01-01T00:00:00Z",
+        }
+
+        assert rate_limit_pause(headers) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_manager_reacts_to_429(self):
+        """Test a 429 halves concurrency and schedules a pause"""
+        manager = APICallManager({"enable_retries": False})
+
+        class TooManyRequests(Exception):
+            status_code = 429
+            response = type("Response", (), {"headers": {"retry-after": "5"}})()
+
+        def failing_call():
+            raise TooManyRequests()
+
+        with pytest.raises(TooManyRequests):
+            await manager.call_anthropic_api(failing_call)
+
+        assert manager.anthropic_concurrency.limit == 4.0
+        assert manager.rate_limiter.anthropic_paused_until > time.monotonic() + 4
+
+
 class TestRetryConfig:
     """Test retry configuration"""
 
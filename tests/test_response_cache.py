@@ -0,0 +1,34 @@
+"""
+Unit tests for the exact-match response cache
+Covers request hashing, expiry and persistence
+"""
+
+import time
+
+from utils.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test exact-match response lookups"""
+
+    def test_key_depends_on_every_parameter(self):
+        """Test keys differ when any request parameter differs"""
+        key = ResponseCache.make_key(model="m", prompt="p", max_tokens=10)
+
+        assert key == ResponseCache.make_key(max_tokens=10, prompt="p", model="m")
+        assert key != ResponseCache.make_key(model="m", prompt="p", max_tokens=11)
+
+    def test_round_trip_through_disk(self, tmp_path):
+        """Test a new cache instance reads saved responses"""
+        ResponseCache(cache_dir=str(tmp_path)).put("k", "reply")
+
+        assert ResponseCache(cache_dir=str(tmp_path)).get("k") == "reply"
+        assert ResponseCache(cache_dir=str(tmp_path)).get("other") is None
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Test entries past their TTL are not returned"""
+        cache = ResponseCache(cache_dir=str(tmp_path), enable_file_cache=False)
+        cache.memory_cache["k"] = (time.time() - 7200, "old")
+        cache.ttl_hours = 1.0
+
+        assert cache.get("k") is None
@@ -0,0 +1,82 @@
+"""
+Unit tests for the semantic response cache
+Covers similarity matching, exact keys, expiry and persistence
+"""
+
+import time
+
+from utils.semantic_cache import SemanticCache, cosine_similarity, vectorize
+
+
+class TestSimilarity:
+    """Test term-vector similarity"""
+
+    def test_identical_text_is_one(self):
+        """Test identical text scores 1.0 regardless of case"""
+        vec = vectorize("AI in Healthcare")
+
+        assert abs(cosine_similarity(vec, vectorize("ai in healthcare")) - 1.0) < 1e-9
+
+    def test_unrelated_text_is_zero(self):
+        """Test text without shared words scores 0.0"""
+        assert cosine_similarity(vectorize("solar power"), vectorize("deep sea")) == 0.0
+
+    def test_empty_text(self):
+        """Test empty text produces an empty vector"""
+        assert vectorize("") == {}
+
+
+class TestSemanticCache:
+    """Test response cache lookups"""
+
+    def make_cache(self, tmp_path, **kwargs):
+        return SemanticCache(cache_dir=str(tmp_path / "responses"), **kwargs)
+
+    def test_hit_for_similar_text(self, tmp_path):
+        """Test a near-identical request reuses the response"""
+        cache = self.make_cache(tmp_path, similarity_threshold=0.8)
+        key = SemanticCache.make_key("standard", "default", "Market Trends")
+        cache.put(key, "AI in healthcare market trends for 2024", "cached section")
+
+        assert cache.get(key, "AI in healthcare market trends 2024") == "cached section"
+        assert cache.hits == 1
+
+    def test_miss_for_different_key(self, tmp_path):
+        """Test requests for another template or section never match"""
+        cache = self.make_cache(tmp_path)
+        cache.put(SemanticCache.make_key("standard", "default", "A"), "text", "x")
+
+        assert (
+            cache.get(SemanticCache.make_key("business", "default", "A"), "text")
+            is None
+        )
+        assert cache.misses == 1
+
+    def test_make_key_normalizes_case_and_spacing(self):
+        """Test keys ignore case and repeated whitespace"""
+        assert SemanticCache.make_key(" Market  Trends") == SemanticCache.make_key(
+            "market trends"
+        )
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Test entries past their TTL are not returned"""
+        cache = self.make_cache(tmp_path, ttl_hours=1.0)
+        cache.put("k", "same text", "old")
+        cache.entries["k"][0].timestamp = time.time() - 7200
+
+        assert cache.get("k", "same text") is None
+
+    def test_entries_persist_to_disk(self, tmp_path):
+        """Test a new cache instance loads saved responses"""
+        self.make_cache(tmp_path).put("k", "same text", "saved")
+
+        assert self.make_cache(tmp_path).get("k", "same text") == "saved"
+
+    def test_eviction_respects_max_size(self, tmp_path):
+        """Test the oldest entries are evicted when the cache is full"""
+        cache = self.make_cache(tmp_path, max_cache_size=5, enable_file_cache=False)
+        for i in range(6):
+            cache.put("k", f"text {i}", f"response {i}")
+
+        assert cache.size == 5
+        assert cache.get("k", "text 0") is None
@@ -1,9 +1,14 @@
 """
 Utils package for Deep Research Report Agent
-Contains utility modules for prompts, JSON parsing, rate limiting, token management, and search caching
+Contains utility modules for prompts, JSON parsing, rate limiting, token management, and search and response caching
 """
 
-from .json_parser import RobustJSONParser, parse_report_plan, parse_search_queries
+from .json_parser import (
+    RobustJSONParser,
+    parse_bulk_search_queries,
+    parse_report_plan,
+    parse_search_queries,
+)
 from .observability import (
     ComponentType,
     OperationType,
@@ -18,7 +23,9 @@ from .prompt_versioning import (
     get_prompt_version_manager,
 )
 from .rate_limiter import APICallManager, get_rate_limiter
+from .response_cache import ResponseCache, create_response_cache
 from .search_cache import CacheStats, SearchCache, create_search_cache
+from .semantic_cache import SemanticCache, create_semantic_cache
 from .token_manager import TokenManager, create_token_manager, estimate_content_tokens
 
 __all__ = [
@@ -26,6 +33,7 @@ __all__ = [
     "PromptLoader",
     "parse_report_plan",
     "parse_search_queries",
+    "parse_bulk_search_queries",
     "RobustJSONParser",
     "get_rate_limiter",
     "APICallManager",
@@ -35,6 +43,10 @@ __all__ = [
     "SearchCache",
     "create_search_cache",
     "CacheStats",
+    "ResponseCache",
+    "create_response_cache",
+    "SemanticCache",
+    "create_semantic_cache",
     "PromptVersionManager",
     "get_prompt_version_manager",
     "PromptVersion",
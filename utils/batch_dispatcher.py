@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Message Batches Dispatcher
+Coalesces concurrent Claude requests into discounted batch submissions
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+import weakref
+
+logger = logging.getLogger(__name__)
+
+
+class BatchRequestError(Exception):
+    """A request in a message batch did not succeed"""
+
+    pass
+
+
+class BatchDispatcher:
+    """Collects requests for a short window and sends them as one message batch"""
+
+    def __init__(
+        self,
+        client: Any,
+        window_seconds: float = 30.0,
+        poll_interval: float = 20.0,
+        max_poll_interval: float = 300.0,
+    ):
+        """
+        Initialize the dispatcher
+
+        Args:
+            client: AsyncAnthropic client used to create and poll batches
+            window_seconds: How long to collect requests before submitting
+            poll_interval: First wait between batch status checks
+            max_poll_interval: Cap for the doubling wait between status checks
+        """
+        self.client = client
+        self.window_seconds = window_seconds
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+
+        self._pending: List[Tuple[str, Dict[str, Any], asyncio.Future]] = []
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self._request_count = 0
+
+    async def create_message(self, **params: Any) -> str:
+        """
+        Queue a request for the next batch and wait for the reply text
+
+        Args:
+            **params: Messages API parameters (model, max_tokens, messages, ...)
+
+        Raises:
+            BatchRequestError: If the request errored, expired or was canceled
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._request_count += 1
+        self._pending.append((f"request-{self._request_count}", params, future))
+
+        # The first request of a window schedules the submission
+        if len(self._pending) == 1:
+            task = asyncio.ensure_future(self._flush_after_window())
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+        return await future
+
+    async def _flush_after_window(self) -> None:
+        """Submit the requests collected during one window"""
+        await asyncio.sleep(self.window_seconds)
+        pending, self._pending = self._pending, []
+
+        try:
+            replies = await self._run_batch(
+                {custom_id: params for custom_id, params, _ in pending}
+            )
+        except Exception as e:
+            logger.warning(f"Message batch of {len(pending)} requests failed: {e}")
+            replies = {}
+            error: Optional[Exception] = e
+        else:
+            error = None
+
+        for custom_id, _, future in pending:
+            if future.done():  # The caller stopped waiting
+                continue
+            if custom_id in replies:
+                future.set_result(replies[custom_id])
+            else:
+                future.set_exception(
+                    error or BatchRequestError(f"Batch request {custom_id} failed")
+                )
+
+    async def _run_batch(self, requests: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """Create a batch, wait for it to end and collect successful replies"""
+        batch = await self.client.messages.batches.create(
+            requests=[
+                {"custom_id": custom_id, "params": params}
+                for custom_id, params in requests.items()
+            ]
+        )
+        logger.info(f"Submitted message batch {batch.id} ({len(requests)} requests)")
+
+        delay = self.poll_interval
+        while batch.processing_status != "ended":
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        replies = {}
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                replies[entry.custom_id] = "".join(
+                    block.text
+                    for block in entry.result.message.content
+                    if block.type == "text"
+                )
+        return replies
+
+
+# One dispatcher per client, so concurrent generators share batches
+_dispatchers: "weakref.WeakKeyDictionary[Any, BatchDispatcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_batch_dispatcher(client: Any, config: Dict[str, Any]) -> BatchDispatcher:
+    """Get or create the batch dispatcher for an Anthropic client"""
+    dispatcher = _dispatchers.get(client)
+    if dispatcher is None:
+        dispatcher = BatchDispatcher(
+            client,
+            window_seconds=config.get("batch_window_seconds", 30.0),
+            poll_interval=config.get("batch_poll_interval", 20.0),
+            max_poll_interval=config.get("batch_max_poll_interval", 300.0),
+        )
+        _dispatchers[client] = dispatcher
+    return dispatcher
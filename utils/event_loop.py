@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Event Loop Setup
+Runs entry-point coroutines on uvloop when it is installed
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup; not available on Windows
+    uvloop = None
+
+T = TypeVar("T")
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop: uvloop if installed, eager tasks on 3.12+"""
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+
+    # Coroutines that finish without suspending (cache hits, open rate limits)
+    # run to completion immediately instead of waiting for a scheduler pass
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+
+    return loop
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a fresh event loop"""
+    runner_factory = getattr(asyncio, "Runner", None)  # Python 3.11+
+    if runner_factory is not None:
+        # Runner also cancels leftover tasks and shuts down the default executor
+        with runner_factory(loop_factory=new_event_loop) as runner:
+            return runner.run(coro)
+
+    loop = new_event_loop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
@@ -10,6 +10,11 @@ from typing import Any, Dict, List, Optional
 
 from .observability import ComponentType, OperationType, get_logger, timed_operation
 
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
 # Structured logger
 logger = get_logger(ComponentType.JSON_PARSER)
 
@@ -17,6 +22,21 @@ logger = get_logger(ComponentType.JSON_PARSER)
 _fallback_logger = logging.getLogger(__name__)
 
 
+def _loads(text: str) -> Any:
+    """
+    Parse JSON with orjson when installed, else the standard library
+
+    orjson is stricter (no NaN/Infinity, 64-bit integers), so anything it
+    rejects gets a second chance with json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 class JSONParseError(Exception):
     """Custom exception for JSON parsing errors"""
 
@@ -110,7 +130,7 @@ class RobustJSONParser:
                 # Try to clean the JSON before parsing
                 cleaned_json = RobustJSONParser._clean_json_string(json_str)
                 try:
-                    return json.loads(cleaned_json)
+                    return _loads(cleaned_json)
                 except json.JSONDecodeError:
                     continue
 
@@ -166,7 +186,7 @@ class RobustJSONParser:
                     json_str = text[start_idx:end_idx]
                     cleaned_json = RobustJSONParser._clean_json_string(json_str)
                     try:
-                        return json.loads(cleaned_json)
+                        return _loads(cleaned_json)
                     except json.JSONDecodeError:
                         pass
 
@@ -179,7 +199,7 @@ class RobustJSONParser:
                     json_str = text[start_idx:end_idx]
                     cleaned_json = RobustJSONParser._clean_json_string(json_str)
                     try:
-                        return json.loads(cleaned_json)
+                        return _loads(cleaned_json)
                     except json.JSONDecodeError:
                         pass
 
@@ -217,7 +237,7 @@ class RobustJSONParser:
             json_str = "\n".join(json_lines)
             cleaned_json = RobustJSONParser._clean_json_string(json_str)
             try:
-                return json.loads(cleaned_json)
+                return _loads(cleaned_json)
             except json.JSONDecodeError:
                 pass
 
@@ -330,3 +350,20 @@ def parse_search_queries(text: str) -> Optional[List[str]]:
         return data
 
     return None
+
+
+def parse_bulk_search_queries(text: str) -> Optional[Dict[str, List[str]]]:
+    """Parse a JSON object mapping section titles to search query arrays"""
+    data = RobustJSONParser.extract_json_from_text(text, "object")
+    if not isinstance(data, dict):
+        return None
+
+    # Keep only well-formed entries; callers fall back for the rest
+    queries = {
+        title: items
+        for title, items in data.items()
+        if isinstance(items, list)
+        and items
+        and all(isinstance(item, str) for item in items)
+    }
+    return queries or None
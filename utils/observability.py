@@ -8,6 +8,7 @@ from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from functools import wraps
+import logging
 from threading import local
 import time
 import traceback
@@ -174,6 +175,10 @@ class StructuredLogger:
         """Get current logging context"""
         return getattr(self._local, "context", None)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a stdlib logging level would be emitted"""
+        return logging.getLogger(self.component.value).isEnabledFor(level)
+
     def debug(self, message: str, **kwargs):
         """Log debug message with context"""
         self.logger.debug(message, **kwargs)
@@ -4,9 +4,19 @@ Handles loading and formatting prompts from separate files with versioning suppo
 """
 
 import importlib
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from weakref import WeakValueDictionary
 
 from config import ReportConfig
+from prompts._compiled import compile_prompt_template
+
+# Stands in for the sources when a writing prompt is rendered in two parts
+_SOURCES_SLOT = "\x00sources\x00"
+
+# Live loaders keyed by config identity and the settings a loader captures
+_loader_cache: "WeakValueDictionary[Tuple[int, str, str, bool], PromptLoader]" = (
+    WeakValueDictionary()
+)
 
 
 class PromptLoader:
@@ -33,6 +43,20 @@ class PromptLoader:
                 print(f"⚠️ Failed to initialize prompt versioning: {e}")
                 self.enable_versioning = False
 
+    @classmethod
+    def for_config(cls, config: ReportConfig) -> "PromptLoader":
+        """Return a shared loader for this config, creating it if needed"""
+        key = (
+            id(config),
+            config.get_prompt_template(),
+            config.get("prompt_version", "default"),
+            config.get("enable_prompt_versioning", True),
+        )
+        loader = _loader_cache.get(key)
+        if loader is None:
+            loader = _loader_cache[key] = cls(config)
+        return loader
+
     def get_structure_prompt(self, topic: str) -> str:
         """Get the appropriate structure planning prompt"""
 
@@ -45,26 +69,37 @@ class PromptLoader:
                 prompt_name, fallback_prompt_name="REPORT_STRUCTURE_PROMPT"
             )
             if versioned_prompt:
-                return versioned_prompt.format(topic=topic)
+                return compile_prompt_template(versioned_prompt)(topic=topic)
 
         # Fall back to static prompts
-        if hasattr(self.planning_prompts, prompt_name):
-            prompt = getattr(self.planning_prompts, prompt_name)
-        else:
-            prompt = self.planning_prompts.REPORT_STRUCTURE_PROMPT
+        if prompt_name not in self.planning_prompts.TEMPLATES:
+            prompt_name = "REPORT_STRUCTURE_PROMPT"
 
-        return prompt.format(topic=topic)
+        return self.planning_prompts.render(prompt_name, topic=topic)
 
     def get_query_generation_prompt(
         self, section_title: str, section_description: str, topic: str
     ) -> str:
         """Get the query generation prompt"""
-        return self.planning_prompts.QUERY_GENERATION_PROMPT.format(
+        return self.planning_prompts.render(
+            "QUERY_GENERATION_PROMPT",
             section_title=section_title,
             section_description=section_description,
             topic=topic,
         )
 
+    def get_bulk_query_generation_prompt(
+        self, topic: str, sections: Iterable[Tuple[str, str]]
+    ) -> str:
+        """Get the prompt generating queries for several sections at once"""
+        return self.planning_prompts.render(
+            "BULK_QUERY_GENERATION_PROMPT",
+            topic=topic,
+            sections="\n".join(
+                f"- {title}: {description}" for title, description in sections
+            ),
+        )
+
     def get_section_writing_prompt(
         self,
         section_title: str,
@@ -79,9 +114,10 @@ class PromptLoader:
         word_count = self.config.get_word_count_for_section_type(section_type)
 
         # Choose the right prompt based on template and section type
-        prompt = self._select_writing_prompt(section_type)
+        prompt_name = self._select_writing_prompt(section_type)
 
-        return prompt.format(
+        return self.writing_prompts.render(
+            prompt_name,
             section_title=section_title,
             section_description=section_description,
             topic=topic,
@@ -89,6 +125,26 @@ class PromptLoader:
             word_count=word_count,
         )
 
+    def get_section_writing_prompt_parts(
+        self,
+        section_title: str,
+        section_description: str,
+        topic: str,
+        section_type: str = "default",
+    ) -> Tuple[str, str]:
+        """
+        Get the section writing prompt split around its sources
+
+        Returns:
+            Text before and after the sources, so callers can size the prompt
+            and then insert sources without rendering it again
+        """
+        prompt = self.get_section_writing_prompt(
+            section_title, section_description, topic, _SOURCES_SLOT, section_type
+        )
+        before_sources, _, after_sources = prompt.rpartition(_SOURCES_SLOT)
+        return before_sources, after_sources
+
     def get_contextual_section_prompt(
         self,
         section_title: str,
@@ -105,11 +161,11 @@ class PromptLoader:
             or section_type == "executive_summary"
         ):
             if self.template == "business":
-                prompt = self.writing_prompts.BUSINESS_EXECUTIVE_SUMMARY_PROMPT
+                prompt_name = "BUSINESS_EXECUTIVE_SUMMARY_PROMPT"
             elif self.template == "academic":
-                prompt = self.writing_prompts.ACADEMIC_ABSTRACT_PROMPT
+                prompt_name = "ACADEMIC_ABSTRACT_PROMPT"
             else:
-                prompt = self.writing_prompts.INTRODUCTION_WRITER_PROMPT
+                prompt_name = "INTRODUCTION_WRITER_PROMPT"
 
         elif (
             section_type == "recommendations"
@@ -117,15 +173,16 @@ class PromptLoader:
             or section_type == "conclusion"
         ):
             if self.template == "business":
-                prompt = self.writing_prompts.BUSINESS_RECOMMENDATIONS_PROMPT
+                prompt_name = "BUSINESS_RECOMMENDATIONS_PROMPT"
             else:
-                prompt = self.writing_prompts.CONCLUSION_WRITER_PROMPT
+                prompt_name = "CONCLUSION_WRITER_PROMPT"
 
         else:
             # Default to introduction prompt
-            prompt = self.writing_prompts.INTRODUCTION_WRITER_PROMPT
+            prompt_name = "INTRODUCTION_WRITER_PROMPT"
 
-        return prompt.format(
+        return self.writing_prompts.render(
+            prompt_name,
             section_title=section_title,
             section_description=section_description,
             topic=topic,
@@ -133,27 +190,27 @@ class PromptLoader:
         )
 
     def _select_writing_prompt(self, section_type: str) -> str:
-        """Select the appropriate writing prompt based on template and section type"""
+        """Select the writing prompt name based on template and section type"""
 
         # Template-specific prompts
         if self.template == "academic":
             if section_type == "literature_review":
-                return self.writing_prompts.ACADEMIC_LITERATURE_REVIEW_PROMPT
+                return "ACADEMIC_LITERATURE_REVIEW_PROMPT"
             elif section_type == "abstract":
-                return self.writing_prompts.ACADEMIC_ABSTRACT_PROMPT
+                return "ACADEMIC_ABSTRACT_PROMPT"
 
         elif self.template == "technical":
             if section_type in ["overview", "architecture", "implementation"]:
-                return self.writing_prompts.TECHNICAL_OVERVIEW_PROMPT
+                return "TECHNICAL_OVERVIEW_PROMPT"
 
         elif self.template == "business":
             if section_type == "executive_summary":
-                return self.writing_prompts.BUSINESS_EXECUTIVE_SUMMARY_PROMPT
+                return "BUSINESS_EXECUTIVE_SUMMARY_PROMPT"
             elif section_type == "recommendations":
-                return self.writing_prompts.BUSINESS_RECOMMENDATIONS_PROMPT
+                return "BUSINESS_RECOMMENDATIONS_PROMPT"
 
         # Default to standard section writer
-        return self.writing_prompts.SECTION_WRITER_PROMPT
+        return "SECTION_WRITER_PROMPT"
 
     def _get_versioned_prompt(
         self, prompt_name: str, fallback_prompt_name: str = None
@@ -218,6 +275,25 @@ class PromptLoader:
                 section_type=section_type,
             )
 
+    def log_prompt_usage_batch(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Log several prompt usages with a single write of the usage log
+
+        Args:
+            events: Dictionaries with the keyword arguments of log_prompt_usage()
+        """
+        if self.enable_versioning and self.version_manager:
+            self.version_manager.log_usage_batch(
+                [
+                    {
+                        "version": self.prompt_version,
+                        "template_type": self.template,
+                        **event,
+                    }
+                    for event in events
+                ]
+            )
+
     def migrate_static_prompts_to_versioned(self) -> Dict[str, int]:
         """
         Migrate existing static prompts to the versioning system
@@ -230,46 +306,21 @@ class PromptLoader:
 
         migration_results = {}
 
-        # Migrate planning prompts
-        planning_attrs = [
-            attr
-            for attr in dir(self.planning_prompts)
-            if not attr.startswith("_") and attr.isupper()
-        ]
-
-        for attr_name in planning_attrs:
-            prompt_text = getattr(self.planning_prompts, attr_name)
-            if isinstance(prompt_text, str):
-                success = self.version_manager.add_prompt_version(
-                    prompt_name=attr_name,
-                    version="v1.0_static",
-                    prompt_text=prompt_text,
-                    description="Migrated from static prompts",
-                )
-                if success:
-                    migration_results[attr_name] = (
-                        migration_results.get(attr_name, 0) + 1
-                    )
-
-        # Migrate writing prompts
-        writing_attrs = [
-            attr
-            for attr in dir(self.writing_prompts)
-            if not attr.startswith("_") and attr.isupper()
-        ]
-
-        for attr_name in writing_attrs:
-            prompt_text = getattr(self.writing_prompts, attr_name)
-            if isinstance(prompt_text, str):
+        # Migrate planning and writing prompts
+        for templates in (
+            self.planning_prompts.TEMPLATES,
+            self.writing_prompts.TEMPLATES,
+        ):
+            for prompt_name, prompt_text in templates.items():
                 success = self.version_manager.add_prompt_version(
-                    prompt_name=attr_name,
+                    prompt_name=prompt_name,
                     version="v1.0_static",
                     prompt_text=prompt_text,
                     description="Migrated from static prompts",
                 )
                 if success:
-                    migration_results[attr_name] = (
-                        migration_results.get(attr_name, 0) + 1
+                    migration_results[prompt_name] = (
+                        migration_results.get(prompt_name, 0) + 1
                     )
 
         return migration_results
@@ -282,7 +333,7 @@ def create_prompt_loader(config: ReportConfig = None) -> PromptLoader:
 
         config = get_config()
 
-    return PromptLoader(config)
+    return PromptLoader.for_config(config)
 
 
 # Convenience functions for quick access
@@ -291,7 +342,7 @@ def get_planning_prompt(topic: str, template: str = "standard") -> str:
     from config import get_config
 
     config = get_config(template)
-    loader = PromptLoader(config)
+    loader = PromptLoader.for_config(config)
     return loader.get_structure_prompt(topic)
 
 
@@ -307,7 +358,7 @@ def get_writing_prompt(
     from config import get_config
 
     config = get_config(template)
-    loader = PromptLoader(config)
+    loader = PromptLoader.for_config(config)
     return loader.get_section_writing_prompt(
         section_title, section_description, topic, sources, section_type
     )
@@ -9,8 +9,9 @@ from datetime import datetime
 import json
 import logging
 import os
+import sys
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +94,17 @@ class PromptVersionManager:
         ] = {}  # prompt_name -> version -> PromptVersion
         self.usage_history: List[PromptUsage] = []
 
+        # Running totals per "prompt:version" key, kept in step with
+        # usage_history: [execution time sum, usage entries, last used]
+        self._usage_totals: Dict[str, List[float]] = {}
+
+        # Resolved (prompt_name, version, fallback) lookups and active versions
+        # per prompt; cleared whenever versions are added or activated
+        self._resolved_versions: Dict[
+            Tuple[str, Optional[str], bool], Optional[PromptVersion]
+        ] = {}
+        self._active_versions: Dict[str, Optional[str]] = {}
+
         # Create directories
         os.makedirs(versions_dir, exist_ok=True)
 
@@ -134,6 +146,7 @@ class PromptVersionManager:
         )
 
         self.prompts[prompt_name][version] = prompt_version
+        self._invalidate_lookups()
         self._save_version(prompt_name, prompt_version)
 
         logger.info(f"Added prompt {prompt_name} version {version}")
@@ -156,35 +169,51 @@ class PromptVersionManager:
         Returns:
             Prompt text or None if not found
         """
+        key = (prompt_name, version, fallback_to_active)
+        if key in self._resolved_versions:
+            prompt_version = self._resolved_versions[key]
+        else:
+            prompt_version = self._resolve_version(
+                prompt_name, version, fallback_to_active
+            )
+            self._resolved_versions[key] = prompt_version
+
+        if prompt_version is None:
+            return None
+
+        # Update usage count
+        if self.enable_analytics:
+            prompt_version.usage_count += 1
+
+        return prompt_version.prompt_text
+
+    def _resolve_version(
+        self, prompt_name: str, version: Optional[str], fallback_to_active: bool
+    ) -> Optional[PromptVersion]:
+        """Resolve a requested version, with active fallback, to a PromptVersion"""
         if prompt_name not in self.prompts:
             logger.warning(f"Prompt {prompt_name} not found")
             return None
 
         # If no version specified, get the active version
         if version is None:
-            version = self._get_active_version(prompt_name)
+            version = self.get_active_version(prompt_name)
             if version is None:
                 logger.warning(f"No active version found for prompt {prompt_name}")
                 return None
 
         # Try to get the specific version
         if version in self.prompts[prompt_name]:
-            prompt_version = self.prompts[prompt_name][version]
-
-            # Update usage count
-            if self.enable_analytics:
-                prompt_version.usage_count += 1
-
-            return prompt_version.prompt_text
+            return self.prompts[prompt_name][version]
 
         # Fallback to active version if requested
-        if fallback_to_active and version != self._get_active_version(prompt_name):
-            active_version = self._get_active_version(prompt_name)
+        if fallback_to_active and version != self.get_active_version(prompt_name):
+            active_version = self.get_active_version(prompt_name)
             if active_version:
                 logger.info(
                     f"Version {version} not found, using active version {active_version}"
                 )
-                return self.get_prompt(
+                return self._resolve_version(
                     prompt_name, active_version, fallback_to_active=False
                 )
 
@@ -212,6 +241,7 @@ class PromptVersionManager:
 
         # Activate the specified version
         self.prompts[prompt_name][version].is_active = True
+        self._invalidate_lookups()
 
         # Save changes
         for v in self.prompts[prompt_name].values():
@@ -245,6 +275,46 @@ class PromptVersionManager:
         if not self.enable_analytics:
             return
 
+        self._record_usage(
+            prompt_name,
+            version,
+            success,
+            quality_score,
+            execution_time,
+            template_type,
+            section_type,
+        )
+
+        # Periodically save usage history
+        if len(self.usage_history) % 10 == 0:  # Save every 10 entries
+            self._save_usage_history()
+
+    def log_usage_batch(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Log several usage events and persist the history once
+
+        Args:
+            events: Dictionaries with the keyword arguments of log_usage()
+        """
+        if not self.enable_analytics or not events:
+            return
+
+        for event in events:
+            self._record_usage(**event)
+
+        self._save_usage_history()
+
+    def _record_usage(
+        self,
+        prompt_name: str,
+        version: str,
+        success: bool,
+        quality_score: float = 0.0,
+        execution_time: float = 0.0,
+        template_type: str = "unknown",
+        section_type: str = "unknown",
+    ) -> None:
+        """Append a usage entry and update the version's running averages"""
         usage = PromptUsage(
             version=f"{prompt_name}:{version}",
             timestamp=time.time(),
@@ -256,6 +326,7 @@ class PromptVersionManager:
         )
 
         self.usage_history.append(usage)
+        self._add_usage_totals(usage)
 
         # Update prompt version metrics
         if prompt_name in self.prompts and version in self.prompts[prompt_name]:
@@ -274,9 +345,19 @@ class PromptVersionManager:
                 new_quality = current_quality + quality_score
                 prompt_version.avg_quality_score = new_quality / total_usage
 
-        # Periodically save usage history
-        if len(self.usage_history) % 10 == 0:  # Save every 10 entries
-            self._save_usage_history()
+    def _add_usage_totals(self, usage: PromptUsage) -> None:
+        """Fold a usage entry into the per-version running totals"""
+        totals = self._usage_totals.get(usage.version)
+        if totals is None:
+            self._usage_totals[usage.version] = [
+                usage.execution_time,
+                1,
+                usage.timestamp,
+            ]
+        else:
+            totals[0] += usage.execution_time
+            totals[1] += 1
+            totals[2] = max(totals[2], usage.timestamp)
 
     def get_performance_metrics(
         self, prompt_name: str
@@ -295,15 +376,12 @@ class PromptVersionManager:
 
         metrics = {}
         for version, prompt_version in self.prompts[prompt_name].items():
-            # Find usage entries for this prompt version
-            version_key = f"{prompt_name}:{version}"
-            version_usage = [u for u in self.usage_history if u.version == version_key]
+            # Aggregates for this prompt version's usage entries
+            totals = self._usage_totals.get(f"{prompt_name}:{version}")
 
-            if version_usage:
-                avg_execution_time = sum(u.execution_time for u in version_usage) / len(
-                    version_usage
-                )
-                last_used = max(u.timestamp for u in version_usage)
+            if totals:
+                execution_time_sum, usage_entries, last_used = totals
+                avg_execution_time = execution_time_sum / usage_entries
             else:
                 avg_execution_time = 0.0
                 last_used = prompt_version.created_at
@@ -363,11 +441,27 @@ class PromptVersionManager:
         Returns:
             Formatted performance report
         """
-        report_lines = ["# Prompt Performance Report", ""]
-        report_lines.append(
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        return "\n".join(self.iter_performance_report(prompt_name))
+
+    def iter_performance_report(self, prompt_name: str = None) -> Iterator[str]:
+        """
+        Generate the performance report one block at a time
+
+        Args:
+            prompt_name: Specific prompt to report on (None for all prompts)
+
+        Yields:
+            The report header, then one block per prompt; joined with newlines
+            they form the create_performance_report() text
+        """
+        yield "\n".join(
+            [
+                "# Prompt Performance Report",
+                "",
+                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                "",
+            ]
         )
-        report_lines.append("")
 
         prompts_to_report = [prompt_name] if prompt_name else list(self.prompts.keys())
 
@@ -375,11 +469,10 @@ class PromptVersionManager:
             if pname not in self.prompts:
                 continue
 
-            report_lines.append(f"## Prompt: {pname}")
-            report_lines.append("")
+            report_lines = [f"## Prompt: {pname}", ""]
 
             metrics = self.get_performance_metrics(pname)
-            active_version = self._get_active_version(pname)
+            active_version = self.get_active_version(pname)
             best_version = self.get_best_performing_version(pname)
 
             if active_version:
@@ -411,10 +504,19 @@ class PromptVersionManager:
 
             report_lines.append("")
 
-        return "\n".join(report_lines)
+            yield "\n".join(report_lines)
 
-    def _get_active_version(self, prompt_name: str) -> Optional[str]:
+    def get_active_version(self, prompt_name: str) -> Optional[str]:
         """Get the active version for a prompt"""
+        try:
+            return self._active_versions[prompt_name]
+        except KeyError:
+            active_version = self._find_active_version(prompt_name)
+            self._active_versions[prompt_name] = active_version
+            return active_version
+
+    def _find_active_version(self, prompt_name: str) -> Optional[str]:
+        """Scan a prompt's versions for the active one"""
         if prompt_name not in self.prompts:
             return None
 
@@ -431,6 +533,11 @@ class PromptVersionManager:
 
         return None
 
+    def _invalidate_lookups(self) -> None:
+        """Forget memoized version lookups after versions change"""
+        self._resolved_versions.clear()
+        self._active_versions.clear()
+
     def _save_version(self, prompt_name: str, prompt_version: PromptVersion) -> None:
         """Save a prompt version to disk"""
         filename = f"{prompt_name}_{prompt_version.version}.json"
@@ -452,10 +559,11 @@ class PromptVersionManager:
                         data = json.load(f)
 
                     prompt_version = PromptVersion(**data)
+                    prompt_version.version = sys.intern(prompt_version.version)
 
                     # Extract prompt name from filename
-                    prompt_name = filename.replace(
-                        f"_{prompt_version.version}.json", ""
+                    prompt_name = sys.intern(
+                        filename.replace(f"_{prompt_version.version}.json", "")
                     )
 
                     if prompt_name not in self.prompts:
@@ -488,34 +596,37 @@ class PromptVersionManager:
                 data = json.load(f)
 
             self.usage_history = [PromptUsage(**entry) for entry in data]
+            self._usage_totals = {}
+            for usage in self.usage_history:
+                self._add_usage_totals(usage)
             logger.info(f"Loaded {len(self.usage_history)} usage history entries")
 
         except Exception as e:
             logger.warning(f"Failed to load usage history: {e}")
 
 
-# Global instance
-_prompt_version_manager = None
+# Global instances, one per storage location / analytics setting
+_prompt_version_managers: Dict[Tuple[str, str, bool], PromptVersionManager] = {}
 
 
 def get_prompt_version_manager(config: Dict[str, Any] = None) -> PromptVersionManager:
-    """Get or create the global prompt version manager"""
-    global _prompt_version_manager
-
-    if _prompt_version_manager is None:
-        if config:
-            versions_dir = config.get("prompt_versions_dir", "prompt_versions")
-            usage_log = config.get("prompt_usage_log", "prompt_usage.json")
-            enable_analytics = config.get("enable_prompt_analytics", True)
-        else:
-            versions_dir = "prompt_versions"
-            usage_log = "prompt_usage.json"
-            enable_analytics = True
-
-        _prompt_version_manager = PromptVersionManager(
+    """Get or create the prompt version manager for the given configuration"""
+    if config:
+        versions_dir = config.get("prompt_versions_dir", "prompt_versions")
+        usage_log = config.get("prompt_usage_log", "prompt_usage.json")
+        enable_analytics = config.get("enable_prompt_analytics", True)
+    else:
+        versions_dir = "prompt_versions"
+        usage_log = "prompt_usage.json"
+        enable_analytics = True
+
+    key = (versions_dir, usage_log, enable_analytics)
+    manager = _prompt_version_managers.get(key)
+    if manager is None:
+        manager = _prompt_version_managers[key] = PromptVersionManager(
             versions_dir=versions_dir,
             usage_log_file=usage_log,
             enable_analytics=enable_analytics,
         )
 
-    return _prompt_version_manager
+    return manager
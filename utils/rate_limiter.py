@@ -4,10 +4,13 @@ Prevents hitting rate limits with built-in delays and retry mechanisms
 """
 
 import asyncio
+from collections import deque
+from datetime import datetime, timezone
 from functools import wraps
+import inspect
 import logging
 import time
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Deque, Dict, Mapping, Optional
 
 from .observability import ComponentType, OperationType, get_logger, timed_operation
 
@@ -18,71 +21,274 @@ logger = get_logger(ComponentType.RATE_LIMITER)
 _fallback_logger = logging.getLogger(__name__)
 
 
+class AsyncLeakyBucket:
+    """Leaky bucket pacing: one permit per interval, with optional bursts"""
+
+    def __init__(self, interval: float, burst: int = 1):
+        """
+        Initialize the bucket
+
+        Args:
+            interval: Seconds between permits once the burst is used up
+            burst: Permits that may be granted back to back
+        """
+        self.interval = interval
+        self.burst = max(1, burst)
+        self.last_acquired = 0.0
+
+        # Monotonic time at which every outstanding permit has drained
+        self._drained_at = 0.0
+
+    def reserve(self) -> float:
+        """
+        Claim the next permit without waiting for it
+
+        Concurrent callers each get their own slot, so nothing is held while
+        they sleep.
+
+        Returns:
+            Seconds until the claimed permit may be used
+        """
+        now = time.monotonic()
+        drained_at = max(self._drained_at, now)
+        self._drained_at = drained_at + self.interval
+        return max(0.0, drained_at - now - (self.burst - 1) * self.interval)
+
+
+class AIMDConcurrencyLimiter:
+    """Concurrency cap that grows additively and halves under pressure (AIMD)"""
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        min_concurrency: int = 1,
+        target_latency: Optional[float] = None,
+        window: int = 32,
+    ):
+        """
+        Initialize the limiter
+
+        Args:
+            max_concurrency: Upper bound, and the starting limit
+            min_concurrency: Lower bound the limit never halves below
+            target_latency: Average call latency (seconds) above which the
+                limit shrinks; None reacts to throttling only
+            window: Number of recent latencies averaged
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.target_latency = target_latency
+        self.limit = float(self.max_concurrency)
+        self.active = 0
+
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit"""
+        while self.active >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # A slot handed to this waiter must pass on, or it is lost
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_waiters()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.active += 1
+
+    def release(self) -> None:
+        """Free a slot"""
+        self.active -= 1
+        self._wake_waiters()
+
+    def record_latency(self, latency: float) -> None:
+        """Grow the limit after a call, or halve it once a window runs slow"""
+        self.latencies.append(latency)
+        if (
+            self.target_latency is not None
+            and len(self.latencies) == self.latencies.maxlen
+            and sum(self.latencies) / len(self.latencies) > self.target_latency
+        ):
+            self.latencies.clear()
+            self._decrease()
+            return
+
+        self.limit = min(float(self.max_concurrency), self.limit + 0.5)
+        self._wake_waiters()
+
+    def record_throttled(self) -> None:
+        """Halve the limit after the API rejected a call for rate limits"""
+        self._decrease()
+
+    def _decrease(self) -> None:
+        self.limit = max(float(self.min_concurrency), self.limit * 0.5)
+        logger.info("Reduced API concurrency", concurrency_limit=int(self.limit))
+
+    def _wake_waiters(self) -> None:
+        free_slots = int(self.limit) - self.active
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+    async def __aenter__(self) -> "AIMDConcurrencyLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.release()
+
+
+# Limits reported in anthropic-ratelimit-<kind>-{limit,remaining,reset} headers
+RATE_LIMIT_HEADER_KINDS = ("requests", "tokens", "input-tokens", "output-tokens")
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _seconds_until(timestamp: Optional[str]) -> float:
+    """Seconds from now until an RFC 3339 timestamp, 0 if unknown or past"""
+    if not timestamp:
+        return 0.0
+    try:
+        reset_at = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return 0.0
+    return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def rate_limit_pause(headers: Mapping[str, str], headroom: float = 0.1) -> float:
+    """
+    Seconds to hold off new calls according to Anthropic rate limit headers
+
+    Args:
+        headers: Response headers (lowercase names, or case-insensitive mapping)
+        headroom: Fraction of each limit to keep in reserve
+
+    Returns:
+        The retry-after delay, or the time until the first exhausted limit resets
+    """
+    pause = _parse_float(headers.get("retry-after")) or 0.0
+
+    for kind in RATE_LIMIT_HEADER_KINDS:
+        prefix = f"anthropic-ratelimit-{kind}"
+        limit = _parse_float(headers.get(f"{prefix}-limit"))
+        remaining = _parse_float(headers.get(f"{prefix}-remaining"))
+        if limit is None or remaining is None:
+            continue
+
+        running_low = remaining < limit * headroom
+        if kind == "requests":
+            running_low = running_low or remaining <= 2
+        if running_low:
+            pause = max(pause, _seconds_until(headers.get(f"{prefix}-reset")))
+
+    return pause
+
+
 class RateLimiter:
     """Rate limiter with configurable delays and retry mechanisms"""
 
-    def __init__(self, anthropic_delay: float = 1.0, tavily_delay: float = 0.5):
+    def __init__(
+        self,
+        anthropic_delay: float = 1.0,
+        tavily_delay: float = 0.5,
+        anthropic_burst: int = 1,
+        tavily_burst: int = 1,
+    ):
         """
         Initialize rate limiter
 
         Args:
             anthropic_delay: Delay between Anthropic API calls (seconds)
             tavily_delay: Delay between Tavily API calls (seconds)
+            anthropic_burst: Anthropic calls allowed back to back
+            tavily_burst: Tavily calls allowed back to back
         """
-        self.anthropic_delay = anthropic_delay
-        self.tavily_delay = tavily_delay
-        self.last_anthropic_call = 0.0
-        self.last_tavily_call = 0.0
+        self.anthropic_bucket = AsyncLeakyBucket(anthropic_delay, anthropic_burst)
+        self.tavily_bucket = AsyncLeakyBucket(tavily_delay, tavily_burst)
+
+        # Monotonic time before which rate limit headers asked us to hold off
+        self.anthropic_paused_until = 0.0
+
+    @property
+    def anthropic_delay(self) -> float:
+        return self.anthropic_bucket.interval
+
+    @property
+    def tavily_delay(self) -> float:
+        return self.tavily_bucket.interval
+
+    @property
+    def last_anthropic_call(self) -> float:
+        return self.anthropic_bucket.last_acquired
+
+    @property
+    def last_tavily_call(self) -> float:
+        return self.tavily_bucket.last_acquired
 
     @timed_operation(
         "rate_limit_wait", ComponentType.RATE_LIMITER, OperationType.API_CALL
     )
     async def wait_for_anthropic(self):
-        """Ensure minimum delay between Anthropic API calls"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_anthropic_call
+        """Wait for the next Anthropic API permit"""
+        await self._wait(self.anthropic_bucket, "anthropic", "Anthropic")
 
-        context = {
-            "api": "anthropic",
-            "time_since_last": time_since_last,
-            "required_delay": self.anthropic_delay,
-        }
+    @timed_operation(
+        "rate_limit_wait", ComponentType.RATE_LIMITER, OperationType.API_CALL
+    )
+    async def wait_for_tavily(self):
+        """Wait for the next Tavily API permit"""
+        await self._wait(self.tavily_bucket, "tavily", "Tavily")
+
+    def record_anthropic_headers(
+        self, headers: Mapping[str, str], headroom: float = 0.1
+    ) -> None:
+        """Hold off Anthropic calls when response headers show a limit running out"""
+        pause = rate_limit_pause(headers, headroom)
+        if pause > 0:
+            self.anthropic_paused_until = max(
+                self.anthropic_paused_until, time.monotonic() + pause
+            )
 
-        if time_since_last < self.anthropic_delay:
-            wait_time = self.anthropic_delay - time_since_last
+    async def wait_for_anthropic_quota(self) -> None:
+        """Wait out any pause requested by Anthropic rate limit headers"""
+        wait_time = self.anthropic_paused_until - time.monotonic()
+        if wait_time > 0:
             logger.info(
-                "Rate limiting active for Anthropic API", wait_time=wait_time, **context
+                "Anthropic rate limit nearly exhausted, pausing", wait_time=wait_time
             )
             await asyncio.sleep(wait_time)
-        else:
-            logger.debug("No rate limiting needed for Anthropic API", **context)
 
-        self.last_anthropic_call = time.time()
-
-    @timed_operation(
-        "rate_limit_wait", ComponentType.RATE_LIMITER, OperationType.API_CALL
-    )
-    async def wait_for_tavily(self):
-        """Ensure minimum delay between Tavily API calls"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_tavily_call
+    async def _wait(self, bucket: AsyncLeakyBucket, api: str, name: str) -> None:
+        """Claim a permit from the bucket and sleep until it is due"""
+        wait_time = bucket.reserve()
 
         context = {
-            "api": "tavily",
-            "time_since_last": time_since_last,
-            "required_delay": self.tavily_delay,
+            "api": api,
+            "time_since_last": time.time() - bucket.last_acquired,
+            "required_delay": bucket.interval,
         }
 
-        if time_since_last < self.tavily_delay:
-            wait_time = self.tavily_delay - time_since_last
+        if wait_time > 0:
             logger.info(
-                "Rate limiting active for Tavily API", wait_time=wait_time, **context
+                f"Rate limiting active for {name} API", wait_time=wait_time, **context
             )
             await asyncio.sleep(wait_time)
         else:
-            logger.debug("No rate limiting needed for Tavily API", **context)
+            logger.debug(f"No rate limiting needed for {name} API", **context)
 
-        self.last_tavily_call = time.time()
+        bucket.last_acquired = time.time()
 
 
 class RetryConfig:
@@ -134,11 +340,7 @@ async def retry_with_exponential_backoff(
         try:
             logger.debug("Attempting API call", **context)
 
-            result = (
-                await func(*args, **kwargs)
-                if asyncio.iscoroutinefunction(func)
-                else func(*args, **kwargs)
-            )
+            result = await _call(func, *args, **kwargs)
 
             logger.info("API call successful", **context)
             return result
@@ -166,6 +368,14 @@ async def retry_with_exponential_backoff(
     raise last_exception
 
 
+async def _call(func: Callable, *args, **kwargs) -> Any:
+    """Call a sync or async function, awaiting the result if needed"""
+    result = func(*args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
 class APICallManager:
     """Manages API calls with rate limiting and retry mechanisms"""
 
@@ -181,7 +391,12 @@ class APICallManager:
         # Rate limiting configuration
         anthropic_delay = self.config.get("anthropic_rate_limit_delay", 1.0)
         tavily_delay = self.config.get("tavily_rate_limit_delay", 0.5)
-        self.rate_limiter = RateLimiter(anthropic_delay, tavily_delay)
+        self.rate_limiter = RateLimiter(
+            anthropic_delay,
+            tavily_delay,
+            anthropic_burst=self.config.get("anthropic_rate_limit_burst", 1),
+            tavily_burst=self.config.get("tavily_rate_limit_burst", 1),
+        )
 
         # Retry configuration
         max_retries = self.config.get("max_retries", 3)
@@ -193,6 +408,42 @@ class APICallManager:
         self.rate_limiting_enabled = self.config.get("enable_rate_limiting", True)
         self.retry_enabled = self.config.get("enable_retries", True)
 
+        # Adaptive concurrency and header-based pausing for Anthropic calls
+        self.anthropic_concurrency = AIMDConcurrencyLimiter(
+            max_concurrency=self.config.get("anthropic_max_concurrency", 8),
+            target_latency=self.config.get("anthropic_target_latency"),
+        )
+        self.rate_limit_headroom = self.config.get("rate_limit_headroom", 0.1)
+
+    def record_anthropic_headers(self, headers: Mapping[str, str]) -> None:
+        """Feed Anthropic response headers back into rate limiting"""
+        if self.rate_limiting_enabled:
+            self.rate_limiter.record_anthropic_headers(
+                headers, self.rate_limit_headroom
+            )
+
+    def _track_anthropic_call(self, api_func: Callable) -> Callable:
+        """Run each attempt of an Anthropic call under the adaptive limits"""
+
+        @wraps(api_func)
+        async def tracked_call(*args, **kwargs):
+            await self.rate_limiter.wait_for_anthropic_quota()
+            async with self.anthropic_concurrency:
+                start_time = time.monotonic()
+                try:
+                    result = await _call(api_func, *args, **kwargs)
+                except Exception as e:
+                    if getattr(e, "status_code", None) == 429:
+                        self.anthropic_concurrency.record_throttled()
+                    headers = getattr(getattr(e, "response", None), "headers", None)
+                    if headers is not None:
+                        self.record_anthropic_headers(headers)
+                    raise
+                self.anthropic_concurrency.record_latency(time.monotonic() - start_time)
+                return result
+
+        return tracked_call
+
     async def call_anthropic_api(self, api_func: Callable, *args, **kwargs) -> Any:
         """
         Make a rate-limited call to Anthropic API
@@ -206,17 +457,14 @@ class APICallManager:
         """
         if self.rate_limiting_enabled:
             await self.rate_limiter.wait_for_anthropic()
+            api_func = self._track_anthropic_call(api_func)
 
         if self.retry_enabled:
             return await retry_with_exponential_backoff(
                 api_func, self.retry_config, *args, **kwargs
             )
         else:
-            return (
-                await api_func(*args, **kwargs)
-                if asyncio.iscoroutinefunction(api_func)
-                else api_func(*args, **kwargs)
-            )
+            return await _call(api_func, *args, **kwargs)
 
     async def call_tavily_api(self, api_func: Callable, *args, **kwargs) -> Any:
         """
@@ -237,11 +485,7 @@ class APICallManager:
                 api_func, self.retry_config, *args, **kwargs
             )
         else:
-            return (
-                await api_func(*args, **kwargs)
-                if asyncio.iscoroutinefunction(api_func)
-                else api_func(*args, **kwargs)
-            )
+            return await _call(api_func, *args, **kwargs)
 
 
 # Decorator for automatic rate limiting
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Exact-Match Response Caching System
+Reuses model responses for byte-identical deterministic requests
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Model response cache keyed by a hash of the full request"""
+
+    def __init__(
+        self,
+        cache_dir: str = "cache/llm",
+        ttl_hours: float = 24.0,
+        enable_file_cache: bool = True,
+    ):
+        """
+        Initialize the response cache
+
+        Args:
+            cache_dir: Directory for file-based cache storage
+            ttl_hours: Time-to-live for cache entries in hours
+            enable_file_cache: Whether to persist cache to disk
+        """
+        self.cache_dir = cache_dir
+        self.ttl_hours = ttl_hours
+        self.enable_file_cache = enable_file_cache
+
+        # Cache key -> (timestamp, response); disk entries are read on demand
+        self.memory_cache: Dict[str, Tuple[float, str]] = {}
+
+        if self.enable_file_cache:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(**request: Any) -> str:
+        """Hash the request parameters into a cache key"""
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached response, or None if missing or expired"""
+        entry = self.memory_cache.get(key)
+        if entry is None and self.enable_file_cache:
+            entry = self._load_entry_from_disk(key)
+
+        if entry is None:
+            return None
+
+        timestamp, response = entry
+        if time.time() - timestamp > self.ttl_hours * 3600:
+            self.memory_cache.pop(key, None)
+            return None
+
+        self.memory_cache[key] = entry
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        """Cache a response"""
+        entry = (time.time(), response)
+        self.memory_cache[key] = entry
+
+        if self.enable_file_cache:
+            try:
+                with open(self._entry_file(key), "wb") as f:
+                    pickle.dump(entry, f)
+            except Exception as e:
+                logger.warning(f"Failed to save response to disk: {e}")
+
+    def _entry_file(self, key: str) -> str:
+        """Path of an entry's cache file"""
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _load_entry_from_disk(self, key: str) -> Optional[Tuple[float, str]]:
+        """Read one entry from disk, if present"""
+        try:
+            with open(self._entry_file(key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to load cached response {key}: {e}")
+            return None
+
+
+# Factory function for creating cache instances
+def create_response_cache(config: Dict[str, Any]) -> ResponseCache:
+    """Create a response cache instance with configuration"""
+    return ResponseCache(
+        cache_dir=os.path.join(config.get("cache_dir", "cache"), "llm"),
+        ttl_hours=config.get("cache_ttl_hours", 24.0),
+        enable_file_cache=config.get("enable_file_cache", True),
+    )
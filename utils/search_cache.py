@@ -4,6 +4,7 @@ Search Result Caching System
 Intelligent caching of search results with query similarity detection
 """
 
+from collections import Counter
 from dataclasses import asdict, dataclass
 from difflib import SequenceMatcher
 import hashlib
@@ -144,6 +145,29 @@ class SearchCache:
 
         return combined_similarity
 
+    @staticmethod
+    def _similarity_upper_bound(
+        normalized_query: str,
+        query_chars: Counter,
+        query_words: set,
+        other_query: str,
+    ) -> float:
+        """Cheap upper bound of _calculate_query_similarity for a normalized query"""
+        other = other_query.lower().strip()
+        if normalized_query == other:
+            return 1.0
+
+        # Same bound as SequenceMatcher.quick_ratio(): shared characters
+        total_length = len(normalized_query) + len(other)
+        shared_chars = sum((query_chars & Counter(other)).values())
+        seq_bound = 2.0 * shared_chars / total_length if total_length else 1.0
+
+        other_words = set(other.split())
+        union = len(query_words | other_words)
+        keyword_similarity = len(query_words & other_words) / union if union else 0.0
+
+        return (seq_bound * 0.6) + (keyword_similarity * 0.4)
+
     def _find_similar_cached_query(
         self, query: str, topic: str = ""
     ) -> Optional[CacheEntry]:
@@ -151,20 +175,40 @@ class SearchCache:
         best_match = None
         best_similarity = 0.0
 
+        normalized_query = query.lower().strip()
+        query_chars = Counter(normalized_query)
+        query_words = set(normalized_query.split())
+        topic_boosts: Dict[str, float] = {}
+
         for entry in self.memory_cache.values():
             # Check if entry is expired
             if entry.is_expired(self.ttl_hours):
                 continue
 
-            # Calculate similarity
-            similarity = self._calculate_query_similarity(query, entry.query)
-
-            # Consider topic relevance
+            # Consider topic relevance; entries mostly share a handful of topics
+            boost = 0.0
             if topic and entry.topic:
-                topic_similarity = self._calculate_query_similarity(topic, entry.topic)
-                # Boost similarity if topics are related
-                if topic_similarity > 0.3:
-                    similarity += topic_similarity * 0.2
+                if entry.topic not in topic_boosts:
+                    topic_similarity = self._calculate_query_similarity(
+                        topic, entry.topic
+                    )
+                    # Boost similarity if topics are related
+                    topic_boosts[entry.topic] = (
+                        topic_similarity * 0.2 if topic_similarity > 0.3 else 0.0
+                    )
+                boost = topic_boosts[entry.topic]
+
+            # Skip the full sequence match when even an upper bound cannot win
+            upper_bound = self._similarity_upper_bound(
+                normalized_query, query_chars, query_words, entry.query
+            )
+            if upper_bound + boost < self.similarity_threshold:
+                continue
+            if upper_bound + boost <= best_similarity:
+                continue
+
+            # Calculate similarity
+            similarity = self._calculate_query_similarity(query, entry.query) + boost
 
             # Check if this is the best match so far
             if similarity > best_similarity and similarity >= self.similarity_threshold:
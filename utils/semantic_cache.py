@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Semantic Response Caching System
+Reuses written sections for near-identical section requests across runs
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+import hashlib
+import logging
+import math
+import os
+import pickle
+import re
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def vectorize(text: str) -> Dict[str, float]:
+    """Turn text into a unit-length term-frequency vector"""
+    counts = Counter(_WORD_RE.findall(text.lower()))
+    norm = math.sqrt(sum(count * count for count in counts.values()))
+    if not norm:
+        return {}
+    return {term: count / norm for term, count in counts.items()}
+
+
+def cosine_similarity(vec1: Dict[str, float], vec2: Dict[str, float]) -> float:
+    """Cosine similarity of two unit-length vectors from vectorize()"""
+    if len(vec1) > len(vec2):
+        vec1, vec2 = vec2, vec1
+    return sum(weight * vec2.get(term, 0.0) for term, weight in vec1.items())
+
+
+@dataclass
+class ResponseEntry:
+    """A cached model response with the request it answered"""
+
+    key: str
+    text: str
+    vector: Dict[str, float]
+    response: str
+    timestamp: float
+
+    def is_expired(self, ttl_hours: float) -> bool:
+        """Check if cache entry is expired"""
+        return time.time() - self.timestamp > (ttl_hours * 3600)
+
+
+class SemanticCache:
+    """Response cache matching requests by exact key and similar text"""
+
+    def __init__(
+        self,
+        cache_dir: str = "cache/responses",
+        ttl_hours: float = 24.0,
+        max_cache_size: int = 1000,
+        similarity_threshold: float = 0.92,
+        enable_file_cache: bool = True,
+    ):
+        """
+        Initialize the response cache
+
+        Args:
+            cache_dir: Directory for file-based cache storage
+            ttl_hours: Time-to-live for cache entries in hours
+            max_cache_size: Maximum number of entries to keep in memory
+            similarity_threshold: Minimum cosine similarity for cache hits
+            enable_file_cache: Whether to persist cache to disk
+        """
+        self.cache_dir = cache_dir
+        self.ttl_hours = ttl_hours
+        self.max_cache_size = max_cache_size
+        self.similarity_threshold = similarity_threshold
+        self.enable_file_cache = enable_file_cache
+
+        # Entries grouped by exact key, so lookups only scan comparable requests
+        self.entries: Dict[str, List[ResponseEntry]] = {}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+        if self.enable_file_cache:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._load_cache_from_disk()
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Build the exact-match part of a cache key"""
+        return "\x1f".join(" ".join(part.lower().split()) for part in parts)
+
+    def get(self, key: str, text: str) -> Optional[str]:
+        """
+        Get a cached response for a request
+
+        Args:
+            key: Exact-match key from make_key()
+            text: Request text compared by similarity
+
+        Returns:
+            Cached response if a similar enough request was answered, None otherwise
+        """
+        vector = vectorize(text)
+        best_entry = None
+        best_similarity = self.similarity_threshold
+
+        for entry in self.entries.get(key, ()):
+            if entry.is_expired(self.ttl_hours):
+                continue
+            similarity = cosine_similarity(vector, entry.vector)
+            if similarity >= best_similarity:
+                best_similarity = similarity
+                best_entry = entry
+
+        if best_entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug(f"Response cache HIT ({best_similarity:.2f}): {text[:50]}...")
+        return best_entry.response
+
+    def put(self, key: str, text: str, response: str) -> None:
+        """
+        Cache a response
+
+        Args:
+            key: Exact-match key from make_key()
+            text: Request text compared by similarity
+            response: The model response to reuse
+        """
+        if not response:
+            return
+
+        entry = ResponseEntry(
+            key=key,
+            text=text,
+            vector=vectorize(text),
+            response=response,
+            timestamp=time.time(),
+        )
+        self.entries.setdefault(key, []).append(entry)
+        self.size += 1
+
+        if self.size > self.max_cache_size:
+            self._evict_oldest()
+
+        if self.enable_file_cache:
+            self._save_entry_to_disk(entry)
+
+    def _entry_file(self, entry: ResponseEntry) -> str:
+        """Path of an entry's cache file"""
+        digest = hashlib.md5(f"{entry.key}\x1e{entry.text}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.pkl")
+
+    def _evict_oldest(self) -> None:
+        """Evict the oldest 10% of entries when cache is full"""
+        oldest = sorted(
+            (entry for entries in self.entries.values() for entry in entries),
+            key=lambda entry: entry.timestamp,
+        )[: max(1, self.size // 10)]
+
+        for entry in oldest:
+            self.entries[entry.key].remove(entry)
+            if not self.entries[entry.key]:
+                del self.entries[entry.key]
+        self.size -= len(oldest)
+
+    def _save_entry_to_disk(self, entry: ResponseEntry) -> None:
+        """Save a cache entry to disk"""
+        try:
+            with open(self._entry_file(entry), "wb") as f:
+                pickle.dump(entry, f)
+        except Exception as e:
+            logger.warning(f"Failed to save response cache entry to disk: {e}")
+
+    def _load_cache_from_disk(self) -> None:
+        """Load unexpired cache entries from disk"""
+        for filename in os.listdir(self.cache_dir):
+            if not filename.endswith(".pkl"):
+                continue
+            file_path = os.path.join(self.cache_dir, filename)
+            try:
+                with open(file_path, "rb") as f:
+                    entry = pickle.load(f)
+
+                if entry.is_expired(self.ttl_hours):
+                    os.remove(file_path)
+                else:
+                    self.entries.setdefault(entry.key, []).append(entry)
+                    self.size += 1
+            except Exception as e:
+                logger.warning(f"Failed to load response cache entry {filename}: {e}")
+
+        logger.info(f"Loaded {self.size} response cache entries from disk")
+
+
+# Factory function for creating cache instances
+def create_semantic_cache(config: Dict) -> SemanticCache:
+    """Create a response cache instance with configuration"""
+    return SemanticCache(
+        cache_dir=os.path.join(config.get("cache_dir", "cache"), "responses"),
+        ttl_hours=config.get("semantic_cache_ttl_hours", 24.0),
+        max_cache_size=config.get("max_cache_size", 1000),
+        similarity_threshold=config.get("semantic_cache_threshold", 0.92),
+        enable_file_cache=config.get("enable_file_cache", True),
+    )
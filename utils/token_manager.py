@@ -7,10 +7,13 @@ Handles token counting, content truncation, and context window management
 from dataclasses import dataclass
 import logging
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Characters _format_single_source() adds around a source's title, URL and content
+SOURCE_FORMAT_OVERHEAD = len("Source: \nURL: \nContent: \n---")
+
 
 @dataclass
 class TokenUsage:
@@ -60,6 +63,22 @@ class TokenManager:
         # More accurate estimation considering word boundaries and punctuation
         return len(text) // 3.5  # Slightly more accurate than /4
 
+    def estimate_tokens_batch(self, lengths: Iterable[int]) -> List[int]:
+        """Estimate token counts for several texts from their lengths in one pass"""
+        return [length // 3.5 for length in lengths]
+
+    def estimate_sources_tokens(self, sources: List[Dict]) -> int:
+        """Estimate tokens of formatted sources without building the strings"""
+        return sum(
+            self.estimate_tokens_batch(
+                SOURCE_FORMAT_OVERHEAD
+                + len(src.get("title", "Unknown"))
+                + len(src.get("url", ""))
+                + len(src.get("content", src.get("raw_content", "")))
+                for src in sources
+            )
+        )
+
     def optimize_sources_for_context(
         self, search_results: List[Dict], prompt_text: str
     ) -> Tuple[List[Dict], TokenUsage]:
@@ -87,10 +106,7 @@ class TokenManager:
         )
 
         # Calculate final usage
-        sources_tokens = sum(
-            self.estimate_tokens(self._format_single_source(src))
-            for src in optimized_sources
-        )
+        sources_tokens = self.estimate_sources_tokens(optimized_sources)
         total_tokens = prompt_tokens + sources_tokens
         usage_percentage = (total_tokens / self.context_limit) * 100
 
@@ -211,18 +227,16 @@ class TokenManager:
 
     def format_optimized_sources(self, optimized_sources: List[Dict]) -> str:
         """Format optimized sources for prompt inclusion"""
-        sources_text = ""
+        parts = []
 
         for i, result in enumerate(optimized_sources, 1):
             title = result.get("title", "Unknown")
             content = result.get("content", result.get("raw_content", ""))
             url = result.get("url", "")
 
-            sources_text += (
-                f"\nSource {i}: {title}\nURL: {url}\nContent: {content}\n---"
-            )
+            parts.append(f"\nSource {i}: {title}\nURL: {url}\nContent: {content}\n---")
 
-        return sources_text
+        return "".join(parts)
 
     def get_usage_report(self, usage: TokenUsage) -> str:
         """Generate a human-readable usage report"""